@@ -6,7 +6,7 @@ from naproche.logic.fol import Formula
 def test(t, text, atoms):
     print(f"Testing: {text}")
     print(f"Atoms: {atoms}")
-    s = Sentence(text=text, atoms=atoms)
+    s = Sentence(atoms=atoms)
     res = t.translate_sentence(s, as_axiom=True)
     print(f"Result: {res}")
     print(f"Macros: {t.macros.keys()}")
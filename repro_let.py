@@ -5,7 +5,7 @@ t = Translator()
 
 def test(text):
     print(f"Testing: '{text}'")
-    s = Sentence(text=text, atoms=text.split())
+    s = Sentence(atoms=text.split())
     # Fix atoms splitting for commas and dots
     import re
     atoms = [a for a in re.split(r'(\s+|[,.])', text) if a.strip() and a not in [',', '.']]
@@ -15,14 +15,14 @@ def test(text):
 
     # Case 1: Single math block with comma
     atoms = ['Let', '$x, y$', 'be', 'objects', '.']
-    s = Sentence(text=text, atoms=atoms)
+    s = Sentence(atoms=atoms)
     f = t.translate_sentence(s, as_axiom=True)
     print(f"Result 1 (Single Block): {f}")
 
     # Case 2: Separate tokens (if parser splits on comma inside math? Unlikely for MATH regex)
     # But maybe "Let $x$, $y$ be objects."
     atoms2 = ['Let', '$x$', ',', '$y$', 'be', 'objects', '.']
-    s2 = Sentence(text=text, atoms=atoms2)
+    s2 = Sentence(atoms=atoms2)
     f2 = t.translate_sentence(s2, as_axiom=True)
     print(f"Result 2 (Separate Tokens): {f2}")
 
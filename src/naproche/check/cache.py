@@ -12,7 +12,11 @@ def get_formula_string(formula: Formula) -> str:
 
 
 def compute_hash_formula(formula: Formula) -> str:
-    return hashlib.sha256(get_formula_string(formula).encode("utf-8")).hexdigest()
+    # BLAKE2b is noticeably faster than SHA-256 on CPUs without SHA
+    # extensions; 16 bytes is plenty for cache keying.
+    return hashlib.blake2b(
+        get_formula_string(formula).encode("utf-8"), digest_size=16
+    ).hexdigest()
 
 
 class ProverCache:
@@ -1,4 +1,6 @@
 import os
+import hashlib
+import pickle
 import multiprocessing
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -19,13 +21,15 @@ from naproche.logic.fol import (
     Quantifier,
     Implies,
     Constant,
-    Variable,
     substitute,
-    Function,
     Equal,
     And,
     Or,
     Iff,
+    mk_var,
+    mk_const,
+    mk_func,
+    mk_pred,
 )
 from naproche.check.cache import ProverCache, compute_hash_formula, get_formula_string
 from naproche.check.prover_manager import ProverManager
@@ -35,28 +39,36 @@ from naproche.parser.preprocessor import extract_forthel_blocks
 from naproche.parser.cnl_parser import parse_cnl
 from naproche.logic.converter import convert_ast
 
+AST_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "naproche", "ast")
 
-def verify_task(
-    axioms_repr,
-    context_repr,
-    proof_context_repr,
-    goal_repr,
-    prover_instance,
-    use_cache=True,
-    benchmark_mode=False,
-    prover_manager=None,
-    timeout_override=None
-):
-    all_axioms = axioms_repr + context_repr + proof_context_repr
+# Bump whenever the parser, converter or Statement layout changes in a way
+# that old pickles would still load: the tag is mixed into every cache key,
+# so stale entries are orphaned rather than served.
+_AST_CACHE_SCHEMA = 1
+
+
+class _ResolvedFuture:
+    """Minimal Future stand-in for results already known at submit time."""
 
-    # Precompute hashes
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result
+
+
+def hash_problem(all_axioms, goal_repr):
+    """Compute the hash bundle for a (axioms, goal) problem.
+
+    Returns (axiom_hashes, goal_hash, full_context_hash) where axiom_hashes
+    maps axiom name -> formula hash.
+    """
     # We need map from name to hash to identify used axioms
     axiom_hashes = {}
     for name, f in all_axioms:
         axiom_hashes[name] = compute_hash_formula(f)
 
-    goal_name, goal_f = ("goal", goal_repr)
-    goal_hash = compute_hash_formula(goal_f)
+    goal_hash = compute_hash_formula(goal_repr)
 
     # Context hash for failure caching (all axioms)
     # We use a simple concatenation of sorted hashes for stability
@@ -66,9 +78,33 @@ def verify_task(
     # We also include goal in context hash for failure matching just in case
     full_context_hash = f"{context_hash_str}|GOAL:{goal_hash}"
 
+    return axiom_hashes, goal_hash, full_context_hash
+
+
+def verify_task(
+    axioms_repr,
+    context_repr,
+    proof_context_repr,
+    goal_repr,
+    prover_instance,
+    use_cache=True,
+    benchmark_mode=False,
+    prover_manager=None,
+    timeout_override=None,
+    probe_cache=True,
+    hashes=None,
+):
+    all_axioms = axioms_repr + context_repr + list(proof_context_repr)
+
+    # The submitter may have hashed the problem already for its cache probe.
+    if hashes is None:
+        hashes = hash_problem(all_axioms, goal_repr)
+    axiom_hashes, goal_hash, full_context_hash = hashes
+    goal_name, goal_f = ("goal", goal_repr)
+
     available_hashes_set = set(axiom_hashes.values())
 
-    if use_cache and not benchmark_mode:
+    if use_cache and not benchmark_mode and probe_cache:
         cache = ProverCache()
         cached_result = cache.get_proof(goal_hash, available_hashes_set, full_context_hash)
         if cached_result is not None:
@@ -162,8 +198,12 @@ class StdoutReporter(Reporter):
 class Engine:
     def __init__(self, base_path=".", reporter=None, use_cache=True, benchmark=False):
         self.translator = Translator()
-        self.axioms = []
-        self.context = []
+        # SoA storage: parallel name/formula lists instead of (name, formula)
+        # tuples -- fewer allocations on axiom-heavy files; zip on demand.
+        self.axiom_names = []
+        self.axiom_formulas = []
+        self.context_names = []
+        self.context_formulas = []
         self.counter = 0
         self.base_path = base_path
         self.processed_files = set()
@@ -182,65 +222,79 @@ class Engine:
         else:
             self.cache = None
 
+    def add_axiom(self, name, formula):
+        self.axiom_names.append(name)
+        self.axiom_formulas.append(formula)
+
+    def add_context(self, name, formula):
+        self.context_names.append(name)
+        self.context_formulas.append(formula)
+
+    def axiom_items(self):
+        return zip(self.axiom_names, self.axiom_formulas)
+
+    def context_items(self):
+        return zip(self.context_names, self.context_formulas)
+
     def _add_builtin_axioms(self):
         # ! [X, A, B] : (in(X, setminus(A, B)) <=> (in(X, A) & ~in(X, B)))
-        x = Variable("X_set")
-        a = Variable("A_set")
-        b = Variable("B_set")
+        x = mk_var("X_set")
+        a = mk_var("A_set")
+        b = mk_var("B_set")
 
         # setminus
-        f_setminus = Function("setminus", [a, b])
-        lhs = Predicate("in", [x, f_setminus])
-        rhs = And(Predicate("in", [x, a]), Not(Predicate("in", [x, b])))
+        f_setminus = mk_func("setminus", [a, b])
+        lhs = mk_pred("in", [x, f_setminus])
+        rhs = And(mk_pred("in", [x, a]), Not(mk_pred("in", [x, b])))
         ax_setminus = Quantifier("forall", [x, a, b], Iff(lhs, rhs))
-        self.axioms.append(("builtin_setminus", ax_setminus))
+        self.add_axiom("builtin_setminus", ax_setminus)
 
         # cap
-        f_cap = Function("cap", [a, b])
-        lhs_cap = Predicate("in", [x, f_cap])
-        rhs_cap = And(Predicate("in", [x, a]), Predicate("in", [x, b]))
+        f_cap = mk_func("cap", [a, b])
+        lhs_cap = mk_pred("in", [x, f_cap])
+        rhs_cap = And(mk_pred("in", [x, a]), mk_pred("in", [x, b]))
         ax_cap = Quantifier("forall", [x, a, b], Iff(lhs_cap, rhs_cap))
-        self.axioms.append(("builtin_cap", ax_cap))
+        self.add_axiom("builtin_cap", ax_cap)
 
         # cup
-        f_cup = Function("cup", [a, b])
-        lhs_cup = Predicate("in", [x, f_cup])
-        rhs_cup = Or(Predicate("in", [x, a]), Predicate("in", [x, b]))
+        f_cup = mk_func("cup", [a, b])
+        lhs_cup = mk_pred("in", [x, f_cup])
+        rhs_cup = Or(mk_pred("in", [x, a]), mk_pred("in", [x, b]))
         ax_cup = Quantifier("forall", [x, a, b], Iff(lhs_cup, rhs_cup))
-        self.axioms.append(("builtin_cup", ax_cup))
+        self.add_axiom("builtin_cup", ax_cup)
 
         # empty_set
-        c_empty = Constant("empty_set")
-        ax_empty = Quantifier("forall", [x], Not(Predicate("in", [x, c_empty])))
-        self.axioms.append(("builtin_empty", ax_empty))
+        c_empty = mk_const("empty_set")
+        ax_empty = Quantifier("forall", [x], Not(mk_pred("in", [x, c_empty])))
+        self.add_axiom("builtin_empty", ax_empty)
 
         # singleton(Y) -> {Y}
-        y = Variable("Y_sing")
-        f_sing = Function("singleton", [y])
-        lhs_sing = Predicate("in", [x, f_sing])
+        y = mk_var("Y_sing")
+        f_sing = mk_func("singleton", [y])
+        lhs_sing = mk_pred("in", [x, f_sing])
         rhs_sing = Equal(x, y)
         ax_sing = Quantifier("forall", [x, y], Iff(lhs_sing, rhs_sing))
-        self.axioms.append(("builtin_singleton", ax_sing))
+        self.add_axiom("builtin_singleton", ax_sing)
 
         # set_enum(Y, Z) -> {Y, Z} (pair set)
-        z = Variable("Z_enum")
-        f_enum = Function("set_enum", [y, z])
-        lhs_enum = Predicate("in", [x, f_enum])
+        z = mk_var("Z_enum")
+        f_enum = mk_func("set_enum", [y, z])
+        lhs_enum = mk_pred("in", [x, f_enum])
         rhs_enum = Or(Equal(x, y), Equal(x, z))
         ax_enum = Quantifier("forall", [x, y, z], Iff(lhs_enum, rhs_enum))
-        self.axioms.append(("builtin_set_enum", ax_enum))
+        self.add_axiom("builtin_set_enum", ax_enum)
 
         # pair equality: (a,b) = (c,d) => a=c & b=d
         # Handled by provers usually if tuples are supported, but explicitly:
-        # We model pair as Function("pair", [a,b]).
+        # We model pair as mk_func("pair", [a,b]).
         # Need: ! [A,B,C,D] : (pair(A,B) = pair(C,D) => (A=C & B=D))
         # Note: Converse (A=C & B=D => pair(A,B)=pair(C,D)) is true by equality logic.
-        va, vb, vc, vd = Variable("Va"), Variable("Vb"), Variable("Vc"), Variable("Vd")
-        pair1 = Function("pair", [va, vb])
-        pair2 = Function("pair", [vc, vd])
+        va, vb, vc, vd = mk_var("Va"), mk_var("Vb"), mk_var("Vc"), mk_var("Vd")
+        pair1 = mk_func("pair", [va, vb])
+        pair2 = mk_func("pair", [vc, vd])
         conc = And(Equal(va, vc), Equal(vb, vd))
         ax_pair = Quantifier("forall", [va, vb, vc, vd], Implies(Equal(pair1, pair2), conc))
-        self.axioms.append(("builtin_pair_eq", ax_pair))
+        self.add_axiom("builtin_pair_eq", ax_pair)
 
 
     def check(self, statements: list[Statement], is_included=False):
@@ -264,17 +318,45 @@ class Engine:
         try:
             with open(full_path, "r") as f:
                 content = f.read()
-            blocks = extract_forthel_blocks(content)
-            all_stmts = []
-            for block in blocks:
-                try:
-                    # block is a ForthelBlock, need block.content
-                    ast = parse_cnl(block.content)
-                    stmts = convert_ast(ast)
-                    all_stmts.extend(stmts)
-                except Exception:
-                    # self.reporter.log(f"Error parsing included block: {e}")
-                    pass
+
+            # Try the on-disk AST cache first: re-parsing shared library files
+            # (math/) on every run dominates cold startup.
+            cache_path = None
+            all_stmts = None
+            if self.current_cache_enabled:
+                key = (
+                    hashlib.sha1(content.encode("utf-8")).hexdigest()
+                    + str(os.stat(full_path).st_mtime_ns)
+                    + f"-s{_AST_CACHE_SCHEMA}"
+                )
+                cache_path = os.path.join(AST_CACHE_DIR, f"{key}.pkl")
+                if os.path.exists(cache_path):
+                    try:
+                        with open(cache_path, "rb") as cf:
+                            all_stmts = pickle.load(cf)
+                    except Exception:
+                        all_stmts = None
+
+            if all_stmts is None:
+                blocks = extract_forthel_blocks(content)
+                all_stmts = []
+                for block in blocks:
+                    try:
+                        # block is a ForthelBlock, need block.content
+                        ast = parse_cnl(block.content)
+                        stmts = convert_ast(ast)
+                        all_stmts.extend(stmts)
+                    except Exception:
+                        # self.reporter.log(f"Error parsing included block: {e}")
+                        pass
+
+                if cache_path:
+                    try:
+                        os.makedirs(AST_CACHE_DIR, exist_ok=True)
+                        with open(cache_path, "wb") as cf:
+                            pickle.dump(all_stmts, cf, pickle.HIGHEST_PROTOCOL)
+                    except Exception:
+                        pass
 
             # Recursively check/process with is_included=True
             self.check(all_stmts, is_included=True)
@@ -332,7 +414,7 @@ class Engine:
                 else:
                     name = f"ax_{self.counter}"
                     self.counter += 1
-                    self.axioms.append((name, f))
+                    self.add_axiom(name, f)
                     self.reporter.log(f"Added axiom: {f}")
 
             # Check for macros (keep log, but don't add to axioms if we skip above)
@@ -356,7 +438,7 @@ class Engine:
                 else:
                     name = f"ax_{self.counter}"
                     self.counter += 1
-                    self.axioms.append((name, f))
+                    self.add_axiom(name, f)
                     self.reporter.log(f"Added axiom (Sentence): {f}")
 
             # Check for macros
@@ -382,7 +464,7 @@ class Engine:
                     f = formulas[-1]
                     name = f"thm_{self.counter}"
                     self.counter += 1
-                    self.axioms.append((name, f))
+                    self.add_axiom(name, f)
                     self.reporter.log(f"Added axiom (Theorem): {f}")
             else:
                 self.reporter.log(
@@ -396,7 +478,7 @@ class Engine:
                 if len(formulas) > 0:
                     self.current_goal = formulas[-1]
                     for f in formulas[:-1]:
-                        self.context.append((f"ctx_{self.counter}", f))
+                        self.add_context(f"ctx_{self.counter}", f)
                         self.counter += 1
                         self.reporter.log(f"Added context: {f}")
                     self.reporter.log(f"Goal: {self.current_goal}")
@@ -409,7 +491,10 @@ class Engine:
                 self.check_proof(stmt)
 
     def check_proof(self, proof: Proof):
-        proof_context = []
+        # proof_context is an immutable tuple: each step extends it by one
+        # entry, and snapshots for verification tasks / case scopes can share
+        # it directly instead of copying the whole list per step.
+        proof_context = ()
         scope_stack = []
 
         # Decompose the current goal to setup the proof context
@@ -421,12 +506,12 @@ class Engine:
                     # Strip forall: substitute variables with constants
                     # Since we want to prove it for arbitrary X, we pick a constant 'x'.
                     # We rely on the fact that translator maps Proof variables to lowercase constants.
-                    # e.g. Variable("X") -> Constant("x")
+                    # e.g. mk_var("X") -> mk_const("x")
 
                     term = current_goal.body
                     for v in current_goal.vars:
                         # Assuming Variable names are uppercase, we lowercase them
-                        c = Constant(v.name.lower())
+                        c = mk_const(v.name.lower())
                         term = substitute(term, v.name, c)
                     current_goal = term
 
@@ -434,7 +519,7 @@ class Engine:
                     # but logically it exists.
                 elif isinstance(current_goal, Implies):
                     # Strip implication: assume LHS
-                    proof_context.append((f"goal_assump_{self.counter}", current_goal.left))
+                    proof_context += ((f"goal_assump_{self.counter}", current_goal.left),)
                     self.counter += 1
                     self.reporter.log(f"  Assumed from goal: {current_goal.left}")
                     current_goal = current_goal.right
@@ -449,7 +534,46 @@ class Engine:
         # Use current active prover
         current_prover = self.prover_manager.get_active_prover()
 
-        with ThreadPoolExecutor(max_workers=multiprocessing.cpu_count()) as executor:
+        # Snapshot the global axiom/context pairs once; they do not change
+        # while a proof is being checked.
+        axioms_snapshot = list(self.axiom_items())
+        context_snapshot = list(self.context_items())
+
+        # The executor is created lazily: on fully-cached re-runs every step
+        # resolves synchronously and we never pay for thread startup.
+        executor = None
+
+        def submit_verify(goal_f, ctx_copy):
+            nonlocal executor
+            hashes = None
+            if self.current_cache_enabled and not self.benchmark_mode:
+                all_axioms = axioms_snapshot + context_snapshot + list(ctx_copy)
+                hashes = hash_problem(all_axioms, goal_f)
+                axiom_hashes, goal_hash, full_context_hash = hashes
+                cached_result = self.cache.get_proof(
+                    goal_hash, set(axiom_hashes.values()), full_context_hash
+                )
+                if cached_result is not None:
+                    return _ResolvedFuture((True, cached_result, goal_hash, {}))
+
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=multiprocessing.cpu_count())
+            return executor.submit(
+                verify_task,
+                axioms_snapshot,
+                context_snapshot,
+                ctx_copy,
+                goal_f,
+                current_prover,
+                self.current_cache_enabled,
+                self.benchmark_mode,
+                self.prover_manager,
+                self.timelimit,
+                False,  # cache already probed above
+                hashes,
+            )
+
+        try:
             for i, stmt in enumerate(proof.content):
                 # Handle Directive inside proof (e.g. timelimit)
                 if isinstance(stmt, Directive):
@@ -494,9 +618,9 @@ class Engine:
                 if is_case:
                      # Start new scope
                      # Save current context to stack
-                     scope_stack.append(list(proof_context))
+                     scope_stack.append(proof_context)
                      self.reporter.log(f"Step {i+1}: Case assumption: {f}")
-                     proof_context.append((f"step_{i}", f))
+                     proof_context += ((f"step_{i}", f),)
                      continue
 
                 is_assumption = False
@@ -515,7 +639,7 @@ class Engine:
                     if current_goal:
                         goal_to_negate = current_goal
                         neg_goal = Not(goal_to_negate)
-                        proof_context.append((f"step_{i}", neg_goal))
+                        proof_context += ((f"step_{i}", neg_goal),)
                         self.reporter.log(
                             f"Step {i + 1}: Assumed contrary: {neg_goal}"
                         )
@@ -525,42 +649,20 @@ class Engine:
 
                 elif isinstance(f, Predicate) and f.name == "false":
                     self.reporter.log(f"Step {i + 1}: Contradiction.")
-                    ctx_copy = list(proof_context)
-                    future = executor.submit(
-                        verify_task,
-                        self.axioms,
-                        self.context,
-                        ctx_copy,
-                        Predicate("false", []),
-                        current_prover,
-                        self.current_cache_enabled,
-                        self.benchmark_mode,
-                        self.prover_manager,
-                        self.timelimit
-                    )
+                    ctx_copy = proof_context
+                    future = submit_verify(mk_pred("false", []), ctx_copy)
                     tasks.append((future, i + 1, "Contradiction"))
 
                 elif is_assumption:
                     self.reporter.log(f"Step {i + 1}: Assumption/Definition: {f}")
-                    proof_context.append((f"step_{i}", f))
+                    proof_context += ((f"step_{i}", f),)
                 else:
                     self.reporter.log(f"Step {i + 1}: Verifying {f}")
-                    ctx_copy = list(proof_context)
-                    future = executor.submit(
-                        verify_task,
-                        self.axioms,
-                        self.context,
-                        ctx_copy,
-                        f,
-                        current_prover,
-                        self.current_cache_enabled,
-                        self.benchmark_mode,
-                        self.prover_manager,
-                        self.timelimit
-                    )
+                    ctx_copy = proof_context
+                    future = submit_verify(f, ctx_copy)
                     tasks.append((future, i + 1, f"Verification of {f}"))
 
-                    proof_context.append((f"step_{i}", f))
+                    proof_context += ((f"step_{i}", f),)
 
             self.reporter.log("Waiting for verification tasks...")
             for future, step_num, desc in tasks:
@@ -585,3 +687,6 @@ class Engine:
                     import traceback
                     traceback.print_exc()
                     self.reporter.error(f"Step {step_num}: Task failed with error: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
@@ -3,24 +3,34 @@ from naproche.prover import EProver, VampireProver, DummyProver, Prover
 
 class ProverManager:
     def __init__(self):
-        self._provers: Dict[str, Prover] = {
-            "eprover": EProver(),
-            "vampire": VampireProver(),
-            "dummy": DummyProver(),
+        # Provers are constructed lazily so that Engine startup does not pay
+        # for backends that are never used.
+        self._ctors = {
+            "eprover": EProver,
+            "vampire": VampireProver,
+            "dummy": DummyProver,
         }
+        self._provers: Dict[str, Prover] = {}
         self.active_prover_name = "vampire"
 
     def get_prover(self, name: str) -> Optional[Prover]:
-        return self._provers.get(name)
+        prover = self._provers.get(name)
+        if prover is None:
+            ctor = self._ctors.get(name)
+            if ctor is None:
+                return None
+            prover = ctor()
+            self._provers[name] = prover
+        return prover
 
     def set_active_prover(self, name: str) -> bool:
-        if name in self._provers:
+        if name in self._ctors:
             self.active_prover_name = name
             return True
         return False
 
     def get_active_prover(self) -> Prover:
-        return self._provers[self.active_prover_name]
+        return self.get_prover(self.active_prover_name)
 
     def get_all_provers(self) -> List[Prover]:
-        return list(self._provers.values())
+        return [self.get_prover(name) for name in self._ctors]
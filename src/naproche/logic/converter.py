@@ -1,3 +1,4 @@
+import sys
 from typing import List, Dict, Any, Optional
 from naproche.logic.models import (
     Statement,
@@ -12,12 +13,50 @@ from naproche.logic.models import (
 )
 
 
+# Environment name -> constructor. Starred versions are handled the same as
+# their unstarred counterparts for now.
+ENV_CTOR = {
+    "theorem": lambda name, content, arg: Theorem(name=name, content=content, author=arg),
+    "theorem*": lambda name, content, arg: Theorem(name=name, content=content, author=arg),
+    "definition": lambda name, content, arg: Definition(name=name, content=content),
+    "definition*": lambda name, content, arg: Definition(name=name, content=content),
+    "axiom": lambda name, content, arg: Axiom(name=name, content=content),
+    "axiom*": lambda name, content, arg: Axiom(name=name, content=content),
+    "lemma": lambda name, content, arg: Lemma(name=name, content=content),
+    "lemma*": lambda name, content, arg: Lemma(name=name, content=content),
+    "proof": lambda name, content, arg: Proof(name=name, content=content),
+}
+
+
+def _make_environment(name: str, content: List[Statement], arg) -> Statement:
+    ctor = ENV_CTOR.get(name)
+    if ctor:
+        return ctor(name, content, arg)
+    # Generic block
+    return Block(name=name, content=content)
+
+
 def convert_ast(ast: List[Dict[str, Any]]) -> List[Statement]:
-    statements = []
-    for item in ast:
-        stmt = convert_item(item)
-        if stmt:
-            statements.append(stmt)
+    statements: List[Statement] = []
+    # Explicit work stack instead of convert_item -> convert_ast recursion;
+    # deep documents otherwise pay one Python frame per nested environment.
+    stack = [("item", item, statements) for item in reversed(ast)]
+    while stack:
+        frame = stack.pop()
+        if frame[0] == "item":
+            _, item, out = frame
+            if isinstance(item, dict) and item.get("type") == "environment":
+                children: List[Statement] = []
+                stack.append(("finish", item, children, out))
+                for child in reversed(item["content"]):
+                    stack.append(("item", child, children))
+            else:
+                stmt = convert_item(item)
+                if stmt:
+                    out.append(stmt)
+        else:
+            _, item, children, out = frame
+            out.append(_make_environment(item["name"], children, item.get("arg")))
     return statements
 
 
@@ -31,37 +70,16 @@ def convert_item(item: Dict[str, Any]) -> Optional[Statement]:
         return Directive(name=item["name"], args=item["args"])
 
     elif type_ == "sentence":
-        # Reconstruct text from atoms
-        atoms = item["atoms"]
-        text = " ".join([str(a) for a in atoms])
-        return Sentence(text=text, atoms=atoms)
+        # Normalize parser tokens to plain interned strings once, here: the
+        # translator can then use sentence.atoms directly instead of running
+        # its own [str(a) for a in atoms] pass per sentence. The membership
+        # set shares the interned strings. Sentence.text is reconstructed
+        # lazily from atoms on first access, so no join happens here.
+        atoms = [sys.intern(str(a)) for a in item["atoms"]]
+        return Sentence(atoms=atoms, atoms_set=frozenset(atoms))
 
     elif type_ == "environment":
-        name = item["name"]
-        arg = item.get("arg")
-        content_data = item["content"]
-        content = convert_ast(content_data)
-
-        if name == "theorem*":  # Handling starred versions as same for now
-            return Theorem(name=name, content=content, author=arg)
-        elif name == "definition*":
-            return Definition(name=name, content=content)
-        elif name == "axiom*":
-            return Axiom(name=name, content=content)
-        elif name == "lemma*":
-            return Lemma(name=name, content=content)
-        elif name == "proof":
-            return Proof(name=name, content=content)
-        elif name == "definition":
-            return Definition(name=name, content=content)
-        elif name == "theorem":
-            return Theorem(name=name, content=content, author=arg)
-        elif name == "lemma":
-            return Lemma(name=name, content=content)
-        elif name == "axiom":
-            return Axiom(name=name, content=content)
-        else:
-            # Generic block
-            return Block(name=name, content=content)
+        content = convert_ast(item["content"])
+        return _make_environment(item["name"], content, item.get("arg"))
 
     return None
@@ -1,19 +1,55 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+from weakref import WeakValueDictionary
 import re
 
-@dataclass(frozen=True)
-class Term:
-    pass
+def _write_obj(obj, out):
+    # Children are normally Term/Formula nodes, but rule handlers can leak
+    # None or plain values into args; fall back to str() like the old
+    # f-string formatting did.
+    w = getattr(obj, "_write", None)
+    if w is not None:
+        w(out)
+    else:
+        out.append(str(obj))
+
 
+@dataclass(frozen=True, slots=True)
+class Term:
+    # Lazy caches (slots must be declared now that instances have no
+    # __dict__); excluded from init/repr/comparison.
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _var_names: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _free_vars: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass(frozen=True)
+    def __str__(self):
+        # Serialization is memoized per instance: shared subterms render once
+        # no matter how many enclosing formulas get printed.
+        s = getattr(self, "_str", None)
+        if s is None:
+            buf = []
+            self._emit(buf)
+            s = "".join(buf)
+            object.__setattr__(self, "_str", s)
+        return s
+
+    def _write(self, out):
+        # Append this node's rendering to out, reusing the memoized string
+        # when available; avoids rebuilding intermediate strings per level.
+        s = getattr(self, "_str", None)
+        if s is not None:
+            out.append(s)
+        else:
+            self._emit(out)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Variable(Term):
     name: str
 
-    def __str__(self):
+    def _emit(self, out):
         # Ensure variables are uppercase for TPTP
-        return self.name.upper()
+        out.append(self.name.upper())
 
 
 def quote_name(name: str) -> str:
@@ -21,190 +57,431 @@ def quote_name(name: str) -> str:
     escaped = name.replace("\\", "\\\\").replace("'", "\\'")
     return f"'{escaped}'"
 
+# TPTP identifier: [a-z][a-zA-Z0-9_]*
+_TPTP_ID_RE = re.compile(r"[a-z][a-zA-Z0-9_]*")
+
 def needs_quote(name: str) -> bool:
-    # TPTP identifier: [a-z][a-zA-Z0-9_]*
     if not name: return False
     if not name[0].islower(): return True
-    if not re.fullmatch(r"[a-z][a-zA-Z0-9_]*", name): return True
+    # Fast path: plain lowercase ASCII alphanumerics never need quoting.
+    if name.isalnum() and name.isascii(): return False
+    if not _TPTP_ID_RE.fullmatch(name): return True
     return False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Constant(Term):
     name: str
 
-    def __str__(self):
+    def _emit(self, out):
         # Ensure constants are lowercase or quoted
         real_name = self.name
         if real_name.startswith('\\'):
              real_name = real_name[1:]
-             if real_name and real_name[0].isupper():
-                 return real_name.lower()
-             return real_name.lower()
+             out.append(real_name.lower())
+             return
 
         if needs_quote(real_name):
              if real_name[0].isupper():
                  lower = real_name.lower()
                  if not needs_quote(lower):
-                     return lower
-             return quote_name(real_name)
+                     out.append(lower)
+                     return
+             out.append(quote_name(real_name))
+             return
 
-        return real_name
+        out.append(real_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Function(Term):
     name: str
-    args: List[Term]
+    args: Tuple[Term, ...]
 
-    def __str__(self):
+    def __post_init__(self):
+        # Accept lists from callers but store a hashable tuple.
+        if type(self.args) is not tuple:
+            object.__setattr__(self, "args", tuple(self.args))
+
+    def _emit(self, out):
         name_str = self.name
         if needs_quote(self.name):
             name_str = quote_name(self.name)
 
-        if not self.args:
-            return name_str
+        out.append(name_str)
+        if self.args:
+            out.append("(")
+            for k, a in enumerate(self.args):
+                if k:
+                    out.append(",")
+                _write_obj(a, out)
+            out.append(")")
 
-        args_str = ",".join(str(a) for a in self.args)
-        return f"{name_str}({args_str})"
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Formula:
-    pass
-
+    # Same lazy caches as Term.
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _var_names: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _free_vars: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass(frozen=True)
+    def __str__(self):
+        # Same memoization and buffered emission as Term.
+        s = getattr(self, "_str", None)
+        if s is None:
+            buf = []
+            self._emit(buf)
+            s = "".join(buf)
+            object.__setattr__(self, "_str", s)
+        return s
+
+    def _write(self, out):
+        s = getattr(self, "_str", None)
+        if s is not None:
+            out.append(s)
+        else:
+            self._emit(out)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Predicate(Formula):
     name: str
-    args: List[Term]
+    args: Tuple[Term, ...]
 
-    def __str__(self):
+    def __post_init__(self):
+        # Accept lists from callers but store a hashable tuple.
+        if type(self.args) is not tuple:
+            object.__setattr__(self, "args", tuple(self.args))
+
+    def _emit(self, out):
         name_str = self.name
         if needs_quote(self.name):
-             name_str = quote_name(self.name)
-
-        if not self.args:
-            return name_str
+            name_str = quote_name(self.name)
 
-        args_str = ",".join(str(a) for a in self.args)
-        return f"{name_str}({args_str})"
+        out.append(name_str)
+        if self.args:
+            out.append("(")
+            for k, a in enumerate(self.args):
+                if k:
+                    out.append(",")
+                _write_obj(a, out)
+            out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Equal(Formula):
     left: Term
     right: Term
 
-    def __str__(self):
-        return f"{self.left} = {self.right}"
+    def _emit(self, out):
+        _write_obj(self.left, out)
+        out.append(" = ")
+        _write_obj(self.right, out)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Not(Formula):
     formula: Formula
 
-    def __str__(self):
-        return f"~ ({self.formula})"
+    def _emit(self, out):
+        out.append("~ (")
+        _write_obj(self.formula, out)
+        out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class And(Formula):
     left: Formula
     right: Formula
 
-    def __str__(self):
-        return f"({self.left} & {self.right})"
+    def _emit(self, out):
+        out.append("(")
+        _write_obj(self.left, out)
+        out.append(" & ")
+        _write_obj(self.right, out)
+        out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Or(Formula):
     left: Formula
     right: Formula
 
-    def __str__(self):
-        return f"({self.left} | {self.right})"
+    def _emit(self, out):
+        out.append("(")
+        _write_obj(self.left, out)
+        out.append(" | ")
+        _write_obj(self.right, out)
+        out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Implies(Formula):
     left: Formula
     right: Formula
 
-    def __str__(self):
-        return f"({self.left} => {self.right})"
+    def _emit(self, out):
+        out.append("(")
+        _write_obj(self.left, out)
+        out.append(" => ")
+        _write_obj(self.right, out)
+        out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Iff(Formula):
     left: Formula
     right: Formula
 
-    def __str__(self):
-        return f"({self.left} <=> {self.right})"
+    def _emit(self, out):
+        out.append("(")
+        _write_obj(self.left, out)
+        out.append(" <=> ")
+        _write_obj(self.right, out)
+        out.append(")")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quantifier(Formula):
     type: str  # "forall" or "exists"
-    vars: List[Variable]
+    vars: Tuple[Variable, ...]
     body: Formula
+    # Bound variable names, precomputed so substitution checks membership in
+    # O(1) instead of scanning vars on every call.
+    _bound_names: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
 
-    def __str__(self):
+    def __post_init__(self):
+        # Accept lists from callers but store a hashable tuple.
+        if type(self.vars) is not tuple:
+            object.__setattr__(self, "vars", tuple(self.vars))
+        object.__setattr__(self, "_bound_names", frozenset(v.name for v in self.vars))
+
+    def _emit(self, out):
         vars_str = ",".join(str(v) for v in self.vars)
         q = "!" if self.type == "forall" else "?"
-        return f"({q} [{vars_str}] : {self.body})"
+        out.append(f"({q} [{vars_str}] : ")
+        _write_obj(self.body, out)
+        out.append(")")
+
+
+# Hash-consing for the node kinds that actually repeat: variables,
+# constants and the small function/predicate applications the rules emit
+# over and over (dom(F), in(Z, Y), ...). The table holds weak references,
+# so interned nodes live exactly as long as some formula still uses them.
+_interned = WeakValueDictionary()
+
+
+def mk_var(name: str) -> Variable:
+    key = (Variable, name)
+    node = _interned.get(key)
+    if node is None:
+        node = Variable(name)
+        _interned[key] = node
+    return node
+
+
+def mk_const(name: str) -> Constant:
+    key = (Constant, name)
+    node = _interned.get(key)
+    if node is None:
+        node = Constant(name)
+        _interned[key] = node
+    return node
+
+
+def mk_func(name: str, args) -> Function:
+    args = tuple(args)
+    key = (Function, name, args)
+    node = _interned.get(key)
+    if node is None:
+        node = Function(name, args)
+        _interned[key] = node
+    return node
+
+
+def mk_pred(name: str, args) -> Predicate:
+    args = tuple(args)
+    key = (Predicate, name, args)
+    node = _interned.get(key)
+    if node is None:
+        node = Predicate(name, args)
+        _interned[key] = node
+    return node
+
+
+_BINARY_FORMULAS = (And, Or, Implies, Iff)
+
+
+def _collect_var_names(node) -> frozenset:
+    """All variable names occurring in a term/formula (bound or free)."""
+    names = set()
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        t = type(n)
+        if t is Variable:
+            names.add(n.name)
+        elif t is Function or t is Predicate:
+            stack.extend(n.args)
+        elif t is Equal:
+            stack.append(n.left)
+            stack.append(n.right)
+        elif t is Not:
+            stack.append(n.formula)
+        elif t in _BINARY_FORMULAS:
+            stack.append(n.left)
+            stack.append(n.right)
+        elif t is Quantifier:
+            stack.extend(n.vars)
+            stack.append(n.body)
+    return frozenset(names)
+
+
+def var_names(node) -> frozenset:
+    """Cached variable-name set for a node.
+
+    Lets substitution return untouched subtrees unchanged (structural
+    sharing): a node whose set does not contain the substituted name needs
+    no rebuild at all.
+    """
+    vn = getattr(node, "_var_names", None)
+    if vn is None:
+        vn = _collect_var_names(node)
+        try:
+            object.__setattr__(node, "_var_names", vn)
+        except AttributeError:
+            pass
+    return vn
+
+
+_EMPTY_FVS = frozenset()
+
+
+def free_vars(node) -> frozenset:
+    """Cached free-variable set (of Variable nodes) for a term/formula.
+
+    Iterative post-order walk with the result memoized on every node it
+    touches, so re-analysing a formula built from already-analysed parts
+    (closure after conjunction, nested blocks) costs one attribute read.
+    """
+    fv = getattr(node, "_free_vars", None)
+    if fv is not None:
+        return fv
+    stack = [("visit", node)]
+    while stack:
+        op, n = stack.pop()
+        t = type(n)
+        if op == "visit":
+            if getattr(n, "_free_vars", None) is not None:
+                continue
+            if t is Variable:
+                object.__setattr__(n, "_free_vars", frozenset((n,)))
+            elif t is Constant:
+                object.__setattr__(n, "_free_vars", _EMPTY_FVS)
+            elif t is Function or t is Predicate:
+                stack.append(("make", n))
+                for a in n.args:
+                    stack.append(("visit", a))
+            elif t is Equal:
+                stack.append(("make", n))
+                stack.append(("visit", n.left))
+                stack.append(("visit", n.right))
+            elif t is Not:
+                stack.append(("make", n))
+                stack.append(("visit", n.formula))
+            elif t in _BINARY_FORMULAS:
+                stack.append(("make", n))
+                stack.append(("visit", n.left))
+                stack.append(("visit", n.right))
+            elif t is Quantifier:
+                stack.append(("make", n))
+                stack.append(("visit", n.body))
+            # Leaked non-node children (None) simply contribute nothing.
+        else:
+            if t is Function or t is Predicate:
+                fv = _EMPTY_FVS
+                for a in n.args:
+                    fv = fv | getattr(a, "_free_vars", _EMPTY_FVS)
+            elif t is Equal:
+                fv = getattr(n.left, "_free_vars", _EMPTY_FVS) | getattr(
+                    n.right, "_free_vars", _EMPTY_FVS
+                )
+            elif t is Not:
+                fv = getattr(n.formula, "_free_vars", _EMPTY_FVS)
+            elif t is Quantifier:
+                fv = getattr(n.body, "_free_vars", _EMPTY_FVS) - frozenset(n.vars)
+            else:
+                fv = getattr(n.left, "_free_vars", _EMPTY_FVS) | getattr(
+                    n.right, "_free_vars", _EMPTY_FVS
+                )
+            object.__setattr__(n, "_free_vars", fv)
+    return getattr(node, "_free_vars", _EMPTY_FVS)
 
 
 def substitute_term(term: Term, var_name: str, replacement: Term) -> Term:
-    if isinstance(term, Variable):
-        if term.name == var_name:
-            return replacement
-        return term
-    elif isinstance(term, Function):
-        new_args = [substitute_term(a, var_name, replacement) for a in term.args]
-        return Function(term.name, new_args)
-    elif isinstance(term, Constant):
-        return term
-    return term
+    match term:
+        case Variable(name=name):
+            return replacement if name == var_name else term
+        case Function(name=name, args=args):
+            if var_name not in var_names(term):
+                return term
+            new_args = tuple(substitute_term(a, var_name, replacement) for a in args)
+            return mk_func(name, new_args)
+        case _:
+            # Constants (and anything unknown) contain no variables.
+            return term
 
 
 def substitute(formula: Formula, var_name: str, replacement: Term) -> Formula:
-    if isinstance(formula, Predicate):
-        new_args = [substitute_term(a, var_name, replacement) for a in formula.args]
-        return Predicate(formula.name, new_args)
-    elif isinstance(formula, Equal):
-        return Equal(
-            substitute_term(formula.left, var_name, replacement),
-            substitute_term(formula.right, var_name, replacement),
-        )
-    elif isinstance(formula, Not):
-        return Not(substitute(formula.formula, var_name, replacement))
-    elif isinstance(formula, And):
-        return And(
-            substitute(formula.left, var_name, replacement),
-            substitute(formula.right, var_name, replacement),
-        )
-    elif isinstance(formula, Or):
-        return Or(
-            substitute(formula.left, var_name, replacement),
-            substitute(formula.right, var_name, replacement),
-        )
-    elif isinstance(formula, Implies):
-        return Implies(
-            substitute(formula.left, var_name, replacement),
-            substitute(formula.right, var_name, replacement),
-        )
-    elif isinstance(formula, Iff):
-        return Iff(
-            substitute(formula.left, var_name, replacement),
-            substitute(formula.right, var_name, replacement),
-        )
-    elif isinstance(formula, Quantifier):
-        if any(v.name == var_name for v in formula.vars):
-            return formula
-        return Quantifier(
-            formula.type,
-            formula.vars,
-            substitute(formula.body, var_name, replacement),
-        )
-    return formula
+    if var_name not in var_names(formula):
+        return formula
+
+    # Explicit post-order stack machine instead of recursion: "visit" frames
+    # walk down, "make" frames reassemble from the results list.
+    stack = [("visit", formula)]
+    results = []
+    while stack:
+        op, node = stack.pop()
+        if op == "visit":
+            t = type(node)
+            if var_name not in var_names(node):
+                results.append(node)
+            elif t is Predicate:
+                results.append(
+                    mk_pred(
+                        node.name,
+                        tuple(substitute_term(a, var_name, replacement) for a in node.args),
+                    )
+                )
+            elif t is Equal:
+                results.append(
+                    Equal(
+                        substitute_term(node.left, var_name, replacement),
+                        substitute_term(node.right, var_name, replacement),
+                    )
+                )
+            elif t is Not:
+                stack.append(("make", node))
+                stack.append(("visit", node.formula))
+            elif t in _BINARY_FORMULAS:
+                stack.append(("make", node))
+                stack.append(("visit", node.right))
+                stack.append(("visit", node.left))
+            elif t is Quantifier:
+                if var_name in node._bound_names:
+                    results.append(node)
+                else:
+                    stack.append(("make", node))
+                    stack.append(("visit", node.body))
+            else:
+                results.append(node)
+        else:
+            t = type(node)
+            if t is Not:
+                results.append(Not(results.pop()))
+            elif t is Quantifier:
+                results.append(Quantifier(node.type, node.vars, results.pop()))
+            else:
+                right = results.pop()
+                left = results.pop()
+                results.append(t(left, right))
+    return results[0]
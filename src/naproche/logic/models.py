@@ -2,49 +2,63 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Sentence(Statement):
-    text: str
     atoms: List[str]  # Simplified for now
-
-
-@dataclass
+    # Interned atom membership set, filled in by the converter. Lets the
+    # translator reject keyword rules without scanning the atom list.
+    atoms_set: Optional[frozenset] = None
+    # Reconstructed sentence text. Translation only looks at atoms, so the
+    # join is deferred until something (reporting, assumption detection)
+    # actually reads .text.
+    _text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        t = self._text
+        if t is None:
+            t = " ".join(map(str, self.atoms))
+            self._text = t
+        return t
+
+
+@dataclass(slots=True)
 class Block(Statement):
     name: str
     content: List[Statement]
 
 
-@dataclass
+@dataclass(slots=True)
 class Directive(Statement):
     name: str
     args: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Theorem(Block):
     author: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Definition(Block):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Axiom(Block):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Lemma(Block):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Proof(Block):
     pass
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Set
 from naproche.logic.models import (
     Statement,
@@ -23,46 +25,207 @@ from naproche.logic.fol import (
     Quantifier,
     Term,
     Variable,
+    mk_var,
+    mk_const,
+    mk_func,
+    mk_pred,
+    free_vars,
 )
 import re
 from naproche.parser.math_parser import parse_math, MathTransformer
 
+def _translate_sentence_stmt(translator: "Translator", stmt: Statement) -> List[Formula]:
+    f = translator.translate_sentence(stmt, as_axiom=True)
+    if f:
+        return [translator.closure(f)]
+    return []
+
+
+def _translate_block_stmt(translator: "Translator", stmt: Statement) -> List[Formula]:
+    return translator.translate_block(stmt)
+
+
+def _translate_nothing(translator: "Translator", stmt: Statement) -> List[Formula]:
+    return []
+
+
+# Statement dispatch on exact type: every statement is one of these concrete
+# classes, so a single dict lookup replaces the isinstance chain.
+_STATEMENT_HANDLERS = {
+    Sentence: _translate_sentence_stmt,
+    Definition: _translate_block_stmt,
+    Axiom: _translate_block_stmt,
+    Lemma: _translate_block_stmt,
+    Theorem: _translate_block_stmt,
+    Directive: _translate_nothing,
+    Proof: _translate_nothing,
+}
+
+# Whitespace tokenizer for set-comprehension text conditions.
+_WS_SPLIT_RE = re.compile(r"(\s+)")
+
+# Guard keywords of the sentence rule chain. A single pass over clean_atoms
+# sets one bit per keyword present, so each rule guard is an AND against the
+# mask instead of a linear scan of the atom list.
+_KW_BIT = {
+    kw: 1 << i
+    for i, kw in enumerate(
+        [
+            "iff", "and", "If", "then", "is", "for", "be", "Then", "all",
+            "every", "have", "Assume", "contrary", "class", "elements",
+            "such", "that", "Contradiction", "contradiction", "End", "qed",
+            "in",
+        ]
+    )
+}
+
+
+# Shared nodes for rule handlers with fixed output shapes; the FOL classes
+# are frozen, so reusing one instance is safe and keeps downstream caches hot.
+_V_X_EVERY = mk_var("x_every")
+_V_X_GEN = mk_var("x_gen")
+_V_X_HAS = mk_var("x_has")
+_V_X_COLON = mk_var("x_colon")
+_V_Z_DOM = mk_var("z_dom")
+_P_OBJECT_X_EVERY = mk_pred("object", (_V_X_EVERY,))
+_P_CONTRARY = mk_pred("contrary", [])
+_P_FALSE = mk_pred("false", [])
+_P_DEFINITION = mk_pred("definition", [])
+
+
+# Small literal vocabularies used by the rule arms, hoisted so guards do a
+# frozenset probe instead of allocating a list per test.
+_PREFIXES = frozenset({"Assume", "Then", "Thus", "Therefore", "Hence", "Indeed", "Case"})
+_ARTICLES = frozenset({"a", "an"})
+_DET_HEADS = frozenset({"A", "An", "a", "an"})
+_QUANT_HEADS = frozenset({"all", "every", "each"})
+_PREPOSITIONS = frozenset({"of", "in", "to", "with", "from"})
+
+
+# Literals the rule arms test for besides the _KW_BIT keywords (first-token
+# and positional checks imply membership). A sentence containing none of
+# these, no keyword and no math atom cannot match any rule.
+_NONKW_TRIGGERS = frozenset(
+    {"Let", "Every", "A", "An", "a", "an", "For", "Take", "Define", "define", "has", "are"}
+)
+
+
+_BY_NAME = attrgetter("name")
+
+
+@lru_cache(maxsize=1024)
+def _join_underscore(parts):
+    # Noun phrases repeat heavily across a document ("natural number",
+    # "element of", ...), so the underscore join is cached on the word
+    # tuple; the words are interned, making the key cheap to hash.
+    return "_".join(parts)
+
+
+def _to_var(t):
+    # Coerce a parsed term to a quantifiable Variable by exact type: the
+    # parser can hand back a Constant (lower-case letter) or a Function
+    # (applied symbol) where a binder is being built.
+    tt = type(t)
+    if tt is Variable:
+        return t
+    if tt is Constant or tt is Function:
+        return mk_var(t.name)
+    return t
+
+
+_MATH_PREFIXES = ("$", "\\\\", "\\[")
+
+# Delimiter strip before comma-splitting grouped variables ($i, j$): one
+# regex pass instead of three chained .replace() copies per atom. The
+# SINGLE variant keeps the single-backslash form used by the free-variable
+# scan in the Define arm.
+_MATH_DELIMS_RE = re.compile(r"\$|\\\\\[|\\\\\]")
+_MATH_DELIMS_SINGLE_RE = re.compile(r"\$|\\\[|\\\]")
+
+
+def _is_math(s):
+    # A token is "math" if it opens with a TeX delimiter. The parser never
+    # emits atoms with a delimiter mid-string, so a prefix check replaces
+    # three full substring scans per probe. Module-level so the check is
+    # not re-created as a closure on every translation call.
+    return s.startswith(_MATH_PREFIXES)
+
+
+# Keywords whose arms need every occurrence, not just the first.
+_MULTI_BITS = _KW_BIT["for"] | _KW_BIT["and"]
+
+
+def _keyword_scan(atoms):
+    """One pass over the atoms: keyword presence bitmask, the first index of
+    each keyword, and every position of the split keywords ("for"/"and"),
+    so rule arms need neither membership scans nor .index()/enumerate
+    passes of their own."""
+    mask = 0
+    first = {}
+    multi = {}
+    get = _KW_BIT.get
+    for i, a in enumerate(atoms):
+        b = get(a, 0)
+        if b:
+            mask |= b
+            if a not in first:
+                first[a] = i
+            if b & _MULTI_BITS:
+                multi.setdefault(a, []).append(i)
+    return mask, first, multi
+
 
 class Translator:
     def __init__(self):
         self.macros = {}
         self.synonyms = {}
+        # Memoized translate_sentence results, keyed (atoms, as_axiom) and
+        # invalidated whenever a macro or synonym is registered.
+        self._trans_cache = {}
+        # translate_block results keyed by block identity; the block is kept
+        # as part of the value so the id stays valid for the cache lifetime.
+        self._block_cache = {}
+        # parse_math is pure in its input string, and the same math atom is
+        # probed by several rules per sentence (and recurs across sentences),
+        # so parses are memoized for the lifetime of the translator.
+        self._math_cache = {}
 
     def add_macro(self, phrase: str, replacement: Term):
         # print(f"DEBUG: Adding macro '{phrase}' -> {replacement}")
         self.macros[phrase.lower()] = replacement
+        self._trans_cache.clear()
+        self._block_cache.clear()
 
     def add_synonym(self, singular: str, plural: str):
         self.synonyms[plural] = singular
+        self._trans_cache.clear()
+        self._block_cache.clear()
 
     def normalize_noun(self, noun: str) -> str:
         return self.synonyms.get(noun, noun)
 
     def translate_statement(self, stmt: Statement) -> List[Formula]:
-        if isinstance(stmt, Sentence):
-            f = self.translate_sentence(stmt, as_axiom=True)
-            if f:
-                return [self.closure(f)]
-            return []
-        elif isinstance(stmt, Directive):
-            return []
-        elif isinstance(stmt, Proof):
+        handler = _STATEMENT_HANDLERS.get(type(stmt))
+        if handler is None:
             return []
-        elif (
-            isinstance(stmt, Definition)
-            or isinstance(stmt, Axiom)
-            or isinstance(stmt, Lemma)
-            or isinstance(stmt, Theorem)
-        ):
-            return self.translate_block(stmt)
-        return []
+        return handler(self, stmt)
 
     def translate_block(self, block: Statement) -> List[Formula]:
+        # Blocks are immutable once parsed, so re-translation (closure
+        # construction, re-verification passes) can reuse the first result.
+        cached = self._block_cache.get(id(block))
+        if cached is not None and cached[0] is block:
+            return cached[1]
+        result = self._translate_block(block)
+        self._block_cache[id(block)] = (block, result)
+        return result
+
+    def _translate_block(self, block: Statement) -> List[Formula]:
+        # Directive-only blocks are common in larger corpora; bail before
+        # allocating the accumulator lists.
+        if not any(isinstance(s, Sentence) for s in block.content):
+            return []
+
         assumptions = []
         conclusions = []
 
@@ -70,8 +233,10 @@ class Translator:
             if not isinstance(s, Sentence):
                 continue
 
-            text = s.text.strip()
-            is_assumption = text.startswith("Let") or text.startswith("Assume")
+            # Checking the first atom avoids materializing the joined .text
+            # for every sentence just to sniff its prefix.
+            first = s.atoms[0] if s.atoms else ""
+            is_assumption = first.startswith(("Let", "Assume"))
 
             f = self.translate_sentence(s, as_axiom=True)
 
@@ -84,71 +249,58 @@ class Translator:
         if not conclusions:
             return [self.closure(a) for a in assumptions]
 
-        conc_form = conclusions[0]
-        if len(conclusions) > 1:
-            for c in conclusions[1:]:
-                conc_form = And(conc_form, c)
+        conc_form = self._conjoin(conclusions)
 
         if assumptions:
-            asm_form = assumptions[0]
-            if len(assumptions) > 1:
-                for a in assumptions[1:]:
-                    asm_form = And(asm_form, a)
-
-            imp = Implies(asm_form, conc_form)
+            imp = Implies(self._conjoin(assumptions), conc_form)
             return [self.closure(imp)]
         else:
             return [self.closure(conc_form)]
 
+    def _conjoin(self, formulas: List[Formula]) -> Formula:
+        # Balanced And tree instead of the old left-leaning fold: downstream
+        # traversals (free_vars, serialization) stay O(log n) deep on large
+        # blocks instead of O(n).
+        if len(formulas) == 1:
+            return formulas[0]
+        mid = len(formulas) // 2
+        return And(self._conjoin(formulas[:mid]), self._conjoin(formulas[mid:]))
+
     def closure(self, formula: Formula) -> Formula:
         free_vars = self.get_free_vars(formula)
         if not free_vars:
             return formula
-        vars_list = sorted(list(free_vars), key=lambda v: v.name)
+        if len(free_vars) == 1:
+            # Single-variable closures are the common case; skip the sort.
+            return Quantifier("forall", list(free_vars), formula)
+        vars_list = sorted(free_vars, key=_BY_NAME)
         return Quantifier("forall", vars_list, formula)
 
     def get_free_vars(self, formula: Formula) -> Set[Variable]:
-        if isinstance(formula, Predicate):
-            vars = set()
-            for arg in formula.args:
-                vars.update(self.get_vars_in_term(arg))
-            return vars
-        elif isinstance(formula, Equal):
-            return self.get_vars_in_term(formula.left) | self.get_vars_in_term(
-                formula.right
-            )
-        elif isinstance(formula, Not):
-            return self.get_free_vars(formula.formula)
-        elif (
-            isinstance(formula, And)
-            or isinstance(formula, Or)
-            or isinstance(formula, Implies)
-            or isinstance(formula, Iff)
-        ):
-            return self.get_free_vars(formula.left) | self.get_free_vars(formula.right)
-        elif isinstance(formula, Quantifier):
-            vars = self.get_free_vars(formula.body)
-            for v in formula.vars:
-                if v in vars:
-                    vars.remove(v)
-            return vars
-        return set()
+        # Iterative walk with per-node memoization; see fol.free_vars.
+        return free_vars(formula)
 
     def get_vars_in_term(self, term: Term) -> Set[Variable]:
-        if isinstance(term, Variable):
-            return {term}
-        elif isinstance(term, Function):
-            vars = set()
-            for arg in term.args:
-                vars.update(self.get_vars_in_term(arg))
-            return vars
-        return set()
+        return free_vars(term)
+
+    def _parse_term_goal(self, math_str):
+        # Goal-mode term parsing: a bare variable denotes a fixed object, so
+        # it is read as a constant.
+        res = self.parse_math_safe(math_str)
+        if isinstance(res, Variable):
+            return mk_const(res.name)
+        return res
 
     def parse_math_safe(self, text):
+        cache = self._math_cache
+        if text in cache:
+            return cache[text]
         try:
-            return parse_math(text)
+            res = parse_math(text)
         except Exception:
-            return None
+            res = None
+        cache[text] = res
+        return res
 
     def expand_colon(self, formula: Formula) -> Formula:
         if isinstance(formula, Predicate):
@@ -160,14 +312,14 @@ class Translator:
                     b = t.args[1]
 
                     f_name = f.name if isinstance(f, (Constant, Function)) else str(f)
-                    f_dom = Function("dom", [f])
+                    f_dom = mk_func("dom", [f])
                     cond1 = Equal(f_dom, a)
 
-                    x = Variable("x_colon")
-                    f_app = Function(f_name, [x])
+                    x = _V_X_COLON
+                    f_app = mk_func(f_name, [x])
 
-                    lhs = Predicate("in", [x, a])
-                    rhs = Predicate("in", [f_app, b])
+                    lhs = mk_pred("in", [x, a])
+                    rhs = mk_pred("in", [f_app, b])
                     cond2 = Quantifier("forall", [x], Implies(lhs, rhs))
 
                     return And(cond1, cond2)
@@ -190,21 +342,61 @@ class Translator:
     def translate_sentence(
         self, sentence: Sentence, as_axiom=False
     ) -> Optional[Formula]:
-        text = sentence.text
         atoms = sentence.atoms
-        atoms_str = [str(a) for a in atoms]
+        # The converter already normalized atoms to plain strings; only
+        # sentences built from other sources still need the str() pass.
+        # atoms_str is never mutated in place below, so aliasing is safe.
+        if not atoms or type(atoms[0]) is str:
+            atoms_str = atoms
+        else:
+            atoms_str = [str(a) for a in atoms]
+
+        # Identical sentences recur across blocks (and as synthesized
+        # sub-sentences), and translation is deterministic in the atoms,
+        # as_axiom and the macro/synonym state. The cache is flushed by
+        # add_macro/add_synonym, so state changes cannot serve stale results.
+        cache = self._trans_cache
+        key = (tuple(atoms_str), as_axiom)
+        if key in cache:
+            return cache[key]
+        result = self._translate_sentence_impl(sentence, atoms_str, as_axiom)
+        if len(cache) >= 4096:
+            cache.clear()
+        cache[key] = result
+        return result
+
+    def _translate_atoms(self, atoms, as_axiom) -> Optional[Formula]:
+        # Rules recurse on plain atom lists; probe the memo directly and
+        # build the Sentence wrapper only on a miss.
+        cache = self._trans_cache
+        key = (tuple(atoms), as_axiom)
+        if key in cache:
+            return cache[key]
+        result = self._translate_sentence_impl(Sentence(atoms=atoms), atoms, as_axiom)
+        if len(cache) >= 4096:
+            cache.clear()
+        cache[key] = result
+        return result
+
+    def _translate_sentence_impl(
+        self, sentence: Sentence, atoms_str, as_axiom
+    ) -> Optional[Formula]:
+        # Interned membership set from the converter (None for sentences
+        # synthesized during translation). Tokens only ever disappear between
+        # here and clean_atoms, so absence here is a sound early reject.
+        aset = getattr(sentence, "atoms_set", None)
 
-        def parse_term(math_str):
-            res = self.parse_math_safe(math_str)
-            if isinstance(res, Variable):
-                if not as_axiom:
-                   return Constant(res.name)
-            return res
+        def might_contain(kw):
+            return aset is None or kw in aset
 
-        def is_math(s): return "$" in s or r"\\" in s or r"\[" in s
+        # In axiom mode parse_term is exactly the (memoized) math parse; only
+        # goal mode post-processes, so no per-call closure is needed.
+        parse_term = self.parse_math_safe if as_axiom else self._parse_term_goal
+
+        is_math = _is_math
 
         # Macro: Let ... stand for ...
-        if len(atoms_str) > 4 and atoms_str[0] == "Let" and "stand" in atoms_str and "for" in atoms_str:
+        if len(atoms_str) > 4 and atoms_str[0] == "Let" and might_contain("stand") and might_contain("for") and "stand" in atoms_str and "for" in atoms_str:
             try:
                 stand_idx = atoms_str.index("stand")
                 for_idx = atoms_str.index("for")
@@ -247,64 +439,78 @@ class Translator:
                     i += 1
             atoms_str = new_atoms
 
-        clean_atoms = []
-        for a in atoms_str:
-            if a == "(": break
-            clean_atoms.append(a)
-
-        if clean_atoms and clean_atoms[-1] == ".":
-            clean_atoms.pop()
+        # Cut at the first citation paren and drop a trailing period. The
+        # common case (no paren, no period) aliases atoms_str rather than
+        # copying; a cached clean view on Sentence is not possible because
+        # macro substitution above can rewrite the atoms first.
+        try:
+            cut = atoms_str.index("(")
+        except ValueError:
+            cut = len(atoms_str)
+        if cut and atoms_str[cut - 1] == ".":
+            clean_atoms = atoms_str[: cut - 1]
+        elif cut != len(atoms_str):
+            clean_atoms = atoms_str[:cut]
+        else:
+            clean_atoms = atoms_str
+
+        kw_mask, kw_first, kw_multi = _keyword_scan(clean_atoms)
+        _B = _KW_BIT
+
+        # Fast reject: with no keyword, no other trigger literal and no math
+        # atom, every arm below would fail its guard and the sentence falls
+        # through to None anyway.
+        if (
+            kw_mask == 0
+            and _NONKW_TRIGGERS.isdisjoint(clean_atoms)
+            and not any(is_math(a) for a in clean_atoms)
+        ):
+            return None
 
-        if "iff" in clean_atoms:
-            iff_idx = clean_atoms.index("iff")
+        if kw_mask & _B["iff"]:
+            iff_idx = kw_first["iff"]
             left_atoms = clean_atoms[:iff_idx]
             right_atoms = clean_atoms[iff_idx+1:]
-            left_sent = Sentence(text=" ".join(left_atoms), atoms=left_atoms)
-            right_sent = Sentence(text=" ".join(right_atoms), atoms=right_atoms)
-            left_f = self.translate_sentence(left_sent, as_axiom=as_axiom)
-            right_f = self.translate_sentence(right_sent, as_axiom=as_axiom)
+            left_f = self._translate_atoms(left_atoms, as_axiom)
+            right_f = self._translate_atoms(right_atoms, as_axiom)
             if left_f and right_f:
                 return self.expand_colon(Iff(left_f, right_f))
 
         # Detect "and" (Sentence conjunction)
-        if "and" in clean_atoms:
-            indices = [i for i, x in enumerate(clean_atoms) if x == "and"]
+        if kw_mask & _B["and"]:
+            indices = kw_multi["and"]
             for idx in reversed(indices):
                 left_atoms = clean_atoms[:idx]
                 right_atoms = clean_atoms[idx+1:]
 
-                left_sent = Sentence(text=" ".join(left_atoms), atoms=left_atoms)
-                right_sent = Sentence(text=" ".join(right_atoms), atoms=right_atoms)
 
                 # Check if sides are valid sentences to avoid splitting noun phrases
                 # Recursion might be slow but safe if bounded
                 # We need to be careful with "element of A and B"
                 # But here we are at sentence level.
 
-                left_f = self.translate_sentence(left_sent, as_axiom=as_axiom)
+                left_f = self._translate_atoms(left_atoms, as_axiom)
                 if left_f:
-                    right_f = self.translate_sentence(right_sent, as_axiom=as_axiom)
+                    right_f = self._translate_atoms(right_atoms, as_axiom)
                     if right_f:
                         return self.expand_colon(And(left_f, right_f))
 
-        if "If" in clean_atoms and "then" in clean_atoms:
+        if (kw_mask & (_B["If"] | _B["then"])) == (_B["If"] | _B["then"]):
             try:
-                then_idx = clean_atoms.index("then")
-                if_idx = clean_atoms.index("If")
+                then_idx = kw_first["then"]
+                if_idx = kw_first["If"]
                 if if_idx == 0:
                     left_atoms = clean_atoms[if_idx+1:then_idx]
                     right_atoms = clean_atoms[then_idx+1:]
-                    left_sent = Sentence(text=" ".join(left_atoms), atoms=left_atoms)
-                    right_sent = Sentence(text=" ".join(right_atoms), atoms=right_atoms)
-                    left_f = self.translate_sentence(left_sent, as_axiom=as_axiom)
-                    right_f = self.translate_sentence(right_sent, as_axiom=as_axiom)
+                    left_f = self._translate_atoms(left_atoms, as_axiom)
+                    right_f = self._translate_atoms(right_atoms, as_axiom)
                     if left_f and right_f:
                         return self.expand_colon(Implies(left_f, right_f))
             except: pass
 
         if clean_atoms and (clean_atoms[0] == "every" or clean_atoms[0] == "Every"):
-            if "is" in clean_atoms:
-                is_idx = clean_atoms.index("is")
+            if kw_mask & _B["is"]:
+                is_idx = kw_first["is"]
                 subj_atoms = clean_atoms[1:is_idx]
                 pred_atoms = clean_atoms[is_idx+1:]
 
@@ -314,33 +520,33 @@ class Translator:
                     pred_atoms = pred_atoms[1:]
 
                 if subj_atoms:
-                    v = Variable("x_every")
-                    subj_noun = "_".join(subj_atoms)
+                    v = _V_X_EVERY
+                    subj_noun = _join_underscore(tuple(subj_atoms))
                     subj_pred = None
                     if "of" in subj_atoms:
                         of_idx = subj_atoms.index("of")
                         if of_idx < len(subj_atoms)-1 and is_math(subj_atoms[of_idx+1]):
-                            noun_part = "_".join(subj_atoms[:of_idx])
+                            noun_part = _join_underscore(tuple(subj_atoms[:of_idx]))
                             domain_part = parse_term(subj_atoms[of_idx+1])
-                            subj_pred = Predicate(noun_part, [v, domain_part])
+                            subj_pred = mk_pred(noun_part, [v, domain_part])
 
                     if not subj_pred:
-                        subj_pred = Predicate(subj_noun, [v])
+                        subj_pred = mk_pred(subj_noun, [v])
 
                     pred_body = None
                     if "with" in pred_atoms:
                         with_idx = pred_atoms.index("with")
                         if with_idx < len(pred_atoms)-1 and is_math(pred_atoms[with_idx+1]):
-                            p_noun = "_".join(pred_atoms[:with_idx])
+                            p_noun = _join_underscore(tuple(pred_atoms[:with_idx]))
                             p_other = parse_term(pred_atoms[with_idx+1])
-                            pred_body = Predicate(p_noun, [v, p_other])
+                            pred_body = mk_pred(p_noun, [v, p_other])
 
                     if not pred_body:
                         if "object" in pred_atoms:
-                             pred_body = Predicate("object", [v])
+                             pred_body = _P_OBJECT_X_EVERY
                         else:
-                             p_noun = "_".join(pred_atoms)
-                             pred_body = Predicate(p_noun, [v])
+                             p_noun = _join_underscore(tuple(pred_atoms))
+                             pred_body = mk_pred(p_noun, [v])
 
                     if is_negated_is:
                         pred_body = Not(pred_body)
@@ -348,9 +554,9 @@ class Translator:
                     return Quantifier("forall", [v], Implies(subj_pred, pred_body))
 
 
-        if clean_atoms and clean_atoms[0] in ["A", "An", "a", "an"] and "is" in clean_atoms:
+        if clean_atoms and clean_atoms[0] in _DET_HEADS and kw_mask & _B["is"]:
              try:
-                 is_idx = clean_atoms.index("is")
+                 is_idx = kw_first["is"]
                  if is_idx > 1:
                      noun_words = clean_atoms[1:is_idx]
 
@@ -361,11 +567,11 @@ class Translator:
                          if is_math(w):
                              t = self.parse_math_safe(w)
                              if isinstance(t, (Variable, Constant)):
-                                 args.append(Variable(t.name))
-                         elif w not in ["of", "in", "to", "with", "from"]:
+                                 args.append(mk_var(t.name))
+                         elif w not in _PREPOSITIONS:
                              name_parts.append(w)
 
-                     noun = "_".join(name_parts)
+                     noun = _join_underscore(tuple(name_parts))
                      noun = self.normalize_noun(noun)
 
                      body_atoms = clean_atoms[is_idx+1:]
@@ -374,30 +580,28 @@ class Translator:
                          if is_math(a):
                              t = self.parse_math_safe(a)
                              if isinstance(t, (Variable, Constant)):
-                                 var = Variable(t.name)
+                                 var = mk_var(t.name)
                                  break
                      if var:
-                         synthetic_sent = Sentence(text="", atoms=[f"${var.name}$", "is"] + body_atoms)
-                         rhs = self.translate_sentence(synthetic_sent, as_axiom=as_axiom)
+                         rhs = self._translate_atoms([f"${var.name}$", "is"] + body_atoms, as_axiom)
                          if rhs:
-                             lhs = Predicate(noun, [var] + args)
+                             lhs = mk_pred(noun, [var] + args)
                              return Quantifier("forall", [var], Iff(lhs, rhs))
              except Exception as e:
                  print(f"DEBUG: [A|An] block exception: {e}")
                  import traceback
                  traceback.print_exc()
 
-        if "for" in clean_atoms:
-            indices = [i for i, x in enumerate(clean_atoms) if x == "for"]
+        if kw_mask & _B["for"]:
+            indices = kw_multi["for"]
             if indices and indices[-1] > 0:
                 f_idx = indices[-1]
                 if f_idx + 1 < len(clean_atoms):
                     next_word = clean_atoms[f_idx+1]
-                    if next_word in ["all", "every", "each"]:
+                    if next_word in _QUANT_HEADS:
                         quant_part = clean_atoms[f_idx:]
                         body_part = clean_atoms[:f_idx]
-                        body_sentence = Sentence(text=" ".join(body_part), atoms=body_part)
-                        body_formula = self.translate_sentence(body_sentence, as_axiom=as_axiom)
+                        body_formula = self._translate_atoms(body_part, as_axiom)
                         if body_formula:
                             maths = [x for x in quant_part if is_math(x)]
 
@@ -420,27 +624,26 @@ class Translator:
 
                             if var_str and domain:
                                 # Handle comma separated variables: $x,y$
-                                raw_vars = var_str.replace("$", "").replace(r"\\[", "").replace(r"\\]", "").split(",")
+                                raw_vars = _MATH_DELIMS_RE.sub("", var_str).split(",")
                                 vars_list = []
                                 for rv in raw_vars:
                                     vt = self.parse_math_safe(rv.strip())
                                     if isinstance(vt, (Variable, Constant)):
-                                        vars_list.append(Variable(vt.name))
+                                        vars_list.append(mk_var(vt.name))
                                     else:
                                         if rv.strip():
-                                            vars_list.append(Variable(rv.strip()))
+                                            vars_list.append(mk_var(rv.strip()))
 
                                 if vars_list:
                                     res = body_formula
                                     for v in reversed(vars_list):
-                                        res = Quantifier("forall", [v], Implies(Predicate("in", [v, domain]), res))
+                                        res = Quantifier("forall", [v], Implies(mk_pred("in", [v, domain]), res))
                                     return self.expand_colon(res)
 
                     elif next_word == "some":
                         quant_part = clean_atoms[f_idx:]
                         body_part = clean_atoms[:f_idx]
-                        body_sentence = Sentence(text=" ".join(body_part), atoms=body_part)
-                        body_formula = self.translate_sentence(body_sentence, as_axiom=as_axiom)
+                        body_formula = self._translate_atoms(body_part, as_axiom)
                         if body_formula:
                              rest = quant_part[1:]
                              segments = []
@@ -470,15 +673,15 @@ class Translator:
                                      break
                                  var_name = v_term.name
                                  noun_part = seg[1:v_idx]
-                                 noun = "_".join(noun_part)
+                                 noun = _join_underscore(tuple(noun_part))
                                  noun = self.normalize_noun(noun)
                                  domain_pred = None
                                  if noun == "element" and v_idx + 2 < len(seg) and seg[v_idx+1] == "of":
                                       if is_math(seg[v_idx+2]):
                                            dom = self.parse_math_safe(seg[v_idx+2])
-                                           domain_pred = lambda v, d=dom: Predicate("in", [v, d])
+                                           domain_pred = lambda v, d=dom: mk_pred("in", [v, d])
                                  else:
-                                      domain_pred = lambda v, n=noun: Predicate(n, [v])
+                                      domain_pred = lambda v, n=noun: mk_pred(n, [v])
                                  if domain_pred:
                                      parsed_vars.append((var_name, domain_pred))
                                  else:
@@ -488,7 +691,7 @@ class Translator:
                              if valid and parsed_vars:
                                  result = body_formula
                                  for v_name, dom_func in reversed(parsed_vars):
-                                     v = Variable(v_name)
+                                     v = mk_var(v_name)
                                      cond = dom_func(v)
                                      result = Quantifier("exists", [v], And(cond, result))
                                  return self.expand_colon(result)
@@ -500,9 +703,8 @@ class Translator:
         if n == 1 and is_math(clean_atoms[0]):
             return self.expand_colon(self.parse_math_safe(clean_atoms[0]))
 
-        prefixes = ["Assume", "Then", "Thus", "Therefore", "Hence", "Indeed", "Case"]
         effective_atoms = clean_atoms
-        if clean_atoms and clean_atoms[0] in prefixes:
+        if clean_atoms and clean_atoms[0] in _PREFIXES:
             effective_atoms = clean_atoms[1:]
 
         n_eff = len(effective_atoms)
@@ -514,18 +716,18 @@ class Translator:
             if clean_atoms[0] == "Let" and clean_atoms[1] == "us" and clean_atoms[2] == "show" and clean_atoms[3] == "that":
                 # Translate remainder as a sentence
                 rest_atoms = clean_atoms[4:]
-                rest_sent = Sentence(text=" ".join(rest_atoms), atoms=rest_atoms)
-                return self.translate_sentence(rest_sent, as_axiom=as_axiom)
+                return self._translate_atoms(rest_atoms, as_axiom)
 
-        res = self._translate_logic(clean_atoms, effective_atoms, n, n_eff, parse_term, is_math, as_axiom)
+        res = self._translate_logic(clean_atoms, effective_atoms, n, n_eff, parse_term, is_math, as_axiom, kw_mask, kw_first)
         # print(f"DEBUG: Result for '{text}': {res}")
         if res:
             return self.expand_colon(res)
         return None
 
-    def _translate_logic(self, clean_atoms, effective_atoms, n, n_eff, parse_term, is_math, as_axiom):
-        if "Assume" in clean_atoms and "contrary" in clean_atoms:
-            return Predicate("contrary", [])
+    def _translate_logic(self, clean_atoms, effective_atoms, n, n_eff, parse_term, is_math, as_axiom, kw_mask, kw_first):
+        _B = _KW_BIT
+        if (kw_mask & (_B["Assume"] | _B["contrary"])) == (_B["Assume"] | _B["contrary"]):
+            return _P_CONTRARY
 
         if clean_atoms and clean_atoms[0] == "Assume" and len(clean_atoms) > 2:
              # Updated "Assume X is ..." to handle comma-separated variables in single math token
@@ -537,7 +739,7 @@ class Translator:
              if clean_atoms[2] == "is":
                  is_found = True
                  rest_start_idx = 3
-             elif clean_atoms[2] in ["are", "be"]: # Just in case
+             elif clean_atoms[2] in {"are", "be"}: # Just in case
                  is_found = True
                  rest_start_idx = 3
 
@@ -546,29 +748,29 @@ class Translator:
                  term = self.parse_math_safe(tok)
                  if isinstance(term, (Variable, Constant)):
                      if as_axiom:
-                         variables.append(Variable(term.name))
+                         variables.append(mk_var(term.name))
                      else:
                          variables.append(term)
                  else:
                      # Split manual
-                     inner = tok.replace("$", "").replace(r"\\[", "").replace(r"\\]", "")
+                     inner = _MATH_DELIMS_RE.sub("", tok)
                      parts = inner.split(",")
                      for part in parts:
                          pt = self.parse_math_safe(part.strip())
                          if isinstance(pt, (Variable, Constant)):
                              if as_axiom:
-                                 variables.append(Variable(pt.name))
+                                 variables.append(mk_var(pt.name))
                              else:
                                  variables.append(pt)
 
                  if variables:
                      rest = clean_atoms[rest_start_idx:]
-                     if rest and rest[0] in ["a", "an"]:
+                     if rest and rest[0] in _ARTICLES:
                          rest = rest[1:]
 
                      if len(rest) == 1:
                          noun = rest[0]
-                         preds = [Predicate(noun, [v]) for v in variables]
+                         preds = [mk_pred(noun, [v]) for v in variables]
                          if len(preds) == 1: return preds[0]
                          res = preds[0]
                          for p in preds[1:]: res = And(res, p)
@@ -577,7 +779,7 @@ class Translator:
                          of_idx = rest.index("of")
                          if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
                              domain = parse_term(rest[of_idx+1])
-                             preds = [Predicate("in", [v, domain]) for v in variables]
+                             preds = [mk_pred("in", [v, domain]) for v in variables]
                              if len(preds) == 1: return preds[0]
                              res = preds[0]
                              for p in preds[1:]: res = And(res, p)
@@ -586,17 +788,17 @@ class Translator:
                      elif len(rest) > 1 and "of" in rest:
                          of_idx = rest.index("of")
                          if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
-                             noun_phrase = "_".join(rest[:of_idx])
+                             noun_phrase = _join_underscore(tuple(rest[:of_idx]))
                              domain = parse_term(rest[of_idx+1])
-                             preds = [Predicate(noun_phrase, [v, domain]) for v in variables]
+                             preds = [mk_pred(noun_phrase, [v, domain]) for v in variables]
                              if len(preds) == 1: return preds[0]
                              res = preds[0]
                              for p in preds[1:]: res = And(res, p)
                              return res
 
         if clean_atoms and clean_atoms[0] == "Let":
-            if "be" in clean_atoms:
-                be_idx = clean_atoms.index("be")
+            if kw_mask & _B["be"]:
+                be_idx = kw_first["be"]
 
                 # Check for comma-separated variables in "Let X, Y be sets"
                 variables = []
@@ -611,7 +813,7 @@ class Translator:
                     if is_math(tok):
                         term = self.parse_math_safe(tok)
                         if isinstance(term, Constant) and as_axiom:
-                            term = Variable(term.name)
+                            term = mk_var(term.name)
                         if isinstance(term, Variable) and not as_axiom:
                              term = parse_term(tok)
 
@@ -622,13 +824,13 @@ class Translator:
                              # Try splitting inside math if it wasn't parsed as simple term
                              # But parse_math_safe might return None or complex term
                              # If we have comma inside math block, manual split
-                             inner = tok.replace("$", "").replace(r"\\[", "").replace(r"\\]", "")
+                             inner = _MATH_DELIMS_RE.sub("", tok)
                              parts = inner.split(",")
                              for part in parts:
                                  pt = self.parse_math_safe(part.strip())
                                  if isinstance(pt, (Variable, Constant)):
                                      if as_axiom:
-                                         variables.append(Variable(pt.name))
+                                         variables.append(mk_var(pt.name))
                                      else:
                                          variables.append(pt)
                     else:
@@ -636,7 +838,7 @@ class Translator:
 
                 if variables:
                     rest = clean_atoms[be_idx+1:]
-                    if rest and rest[0] in ["a", "an"]:
+                    if rest and rest[0] in _ARTICLES:
                         rest = rest[1:]
 
                     # Handle "subset of"
@@ -644,7 +846,7 @@ class Translator:
                          of_idx = rest.index("of")
                          if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
                              domain = parse_term(rest[of_idx+1])
-                             preds = [Predicate("subset", [v, domain]) for v in variables]
+                             preds = [mk_pred("subset", [v, domain]) for v in variables]
                              if len(preds) == 1: return preds[0]
                              res = preds[0]
                              for p in preds[1:]: res = And(res, p)
@@ -655,7 +857,7 @@ class Translator:
                          of_idx = rest.index("of")
                          if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
                              domain = parse_term(rest[of_idx+1])
-                             preds = [Predicate("subclass", [v, domain]) for v in variables]
+                             preds = [mk_pred("subclass", [v, domain]) for v in variables]
                              if len(preds) == 1: return preds[0]
                              res = preds[0]
                              for p in preds[1:]: res = And(res, p)
@@ -665,7 +867,7 @@ class Translator:
                         noun = rest[0]
                         noun = self.normalize_noun(noun)
 
-                        preds = [Predicate(noun, [v]) for v in variables]
+                        preds = [mk_pred(noun, [v]) for v in variables]
                         if len(preds) == 1: return preds[0]
                         res = preds[0]
                         for p in preds[1:]: res = And(res, p)
@@ -675,7 +877,7 @@ class Translator:
                          of_idx = rest.index("of")
                          if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
                              domain = parse_term(rest[of_idx+1])
-                             preds = [Predicate("in", [v, domain]) for v in variables]
+                             preds = [mk_pred("in", [v, domain]) for v in variables]
                              if len(preds) == 1: return preds[0]
                              res = preds[0]
                              for p in preds[1:]: res = And(res, p)
@@ -686,19 +888,19 @@ class Translator:
                 if isinstance(t, Equal):
                     return t
 
-        if "Then" in clean_atoms:
+        if kw_mask & _B["Then"]:
             for a in clean_atoms[1:]:
                  if is_math(a):
                      f = self.parse_math_safe(a)
                      if isinstance(f, Formula): return f
 
-        if (clean_atoms and clean_atoms[0] in ["For", "for"]) and ("all" in clean_atoms or "every" in clean_atoms):
+        if (clean_atoms and clean_atoms[0] in {"For", "for"}) and kw_mask & (_B["all"] | _B["every"]):
              vars_domains = []
              i = 0
              while i < len(clean_atoms):
                  v = None
                  d = None
-                 if clean_atoms[i] in ["element", "elements"] and i+3 < len(clean_atoms):
+                 if clean_atoms[i] in {"element", "elements"} and i+3 < len(clean_atoms):
                       if clean_atoms[i+2] == "of" and is_math(clean_atoms[i+1]) and is_math(clean_atoms[i+3]):
                           v = self.parse_math_safe(clean_atoms[i+1])
                           d = self.parse_math_safe(clean_atoms[i+3])
@@ -722,15 +924,15 @@ class Translator:
 
                               if var_str and domain:
                                   # Handle comma separated variables: $x,y$
-                                  raw_vars = var_str.replace("$", "").replace(r"\\[", "").replace(r"\\]", "").split(",")
+                                  raw_vars = _MATH_DELIMS_RE.sub("", var_str).split(",")
                                   vars_list = []
                                   for rv in raw_vars:
                                       vt = self.parse_math_safe(rv.strip())
                                       if isinstance(vt, (Variable, Constant)):
-                                          vars_list.append(Variable(vt.name))
+                                          vars_list.append(mk_var(vt.name))
                                       else:
                                           if rv.strip():
-                                              vars_list.append(Variable(rv.strip()))
+                                              vars_list.append(mk_var(rv.strip()))
 
                                   if vars_list:
                                       for v_item in vars_list:
@@ -742,14 +944,14 @@ class Translator:
                               d = self.parse_math_safe(clean_atoms[i+2])
 
                               # Handle comma separated variables
-                              raw_vars = var_str.replace("$", "").replace(r"\\[", "").replace(r"\\]", "").split(",")
+                              raw_vars = _MATH_DELIMS_RE.sub("", var_str).split(",")
                               vars_list = []
                               for rv in raw_vars:
                                   vt = self.parse_math_safe(rv.strip())
                                   if isinstance(vt, (Variable, Constant)):
-                                      vars_list.append(Variable(vt.name))
+                                      vars_list.append(mk_var(vt.name))
                                   elif rv.strip():
-                                      vars_list.append(Variable(rv.strip()))
+                                      vars_list.append(mk_var(rv.strip()))
 
                               if vars_list and d:
                                   for v_item in vars_list:
@@ -757,8 +959,8 @@ class Translator:
                  i += 1
 
              body = None
-             if "have" in clean_atoms:
-                 h_idx = clean_atoms.index("have")
+             if kw_mask & _B["have"]:
+                 h_idx = kw_first["have"]
                  if h_idx + 1 < len(clean_atoms) and is_math(clean_atoms[h_idx+1]):
                      body = self.parse_math_safe(clean_atoms[h_idx+1])
 
@@ -766,27 +968,26 @@ class Translator:
                  if is_math(clean_atoms[-1]):
                       body = self.parse_math_safe(clean_atoms[-1])
 
-             if not body and "is" in clean_atoms:
+             if not body and kw_mask & _B["is"]:
                   last_atom = clean_atoms[-1]
                   is_noun_math = is_math(last_atom)
-                  if last_atom in ["object", "set"] or is_noun_math:
+                  if last_atom in {"object", "set"} or is_noun_math:
                        noun = last_atom
-                       if "is" in clean_atoms:
-                            is_idx = clean_atoms.index("is")
+                       if kw_mask & _B["is"]:
+                            is_idx = kw_first["is"]
                             if is_idx > 0 and is_math(clean_atoms[is_idx-1]):
                                  term = self.parse_math_safe(clean_atoms[is_idx-1])
-                                 body = Predicate(noun, [term])
+                                 body = mk_pred(noun, [term])
 
              if vars_domains and body:
                  result = body
                  for v, d in reversed(vars_domains):
-                     v_obj = Variable(v.name) if isinstance(v, Constant) else v
-                     if isinstance(v_obj, Function): v_obj = Variable(v_obj.name)
-                     result = Quantifier("forall", [v_obj], Implies(Predicate("in", [v_obj, d]), result))
+                     v_obj = _to_var(v)
+                     result = Quantifier("forall", [v_obj], Implies(mk_pred("in", [v_obj, d]), result))
                  return result
 
 
-        if n_eff >= 5 and "class" in effective_atoms and "elements" in effective_atoms:
+        if n_eff >= 5 and (kw_mask & (_B["class"] | _B["elements"])) == (_B["class"] | _B["elements"]) and "class" in effective_atoms and "elements" in effective_atoms:
              try:
                  class_idx = effective_atoms.index("class")
                  elem_idx = effective_atoms.index("elements")
@@ -807,9 +1008,9 @@ class Translator:
                                  B_atom = effective_atoms[of2_idx+1]
                                  if is_math(B_atom):
                                      domain_B = parse_term(B_atom)
-                                     x = Variable("x_gen")
-                                     lhs = Predicate("in", [x, term_A])
-                                     rhs = And(Predicate("in", [x, domain_B]), Predicate(pred_name, [x]))
+                                     x = _V_X_GEN
+                                     lhs = mk_pred("in", [x, term_A])
+                                     rhs = And(mk_pred("in", [x, domain_B]), mk_pred(pred_name, [x]))
                                      return Quantifier("forall", [x], Iff(lhs, rhs))
              except Exception:
                  pass
@@ -824,18 +1025,17 @@ class Translator:
                      if such_idx + 1 < len(rest) and rest[such_idx+1] == "that":
                          cond_atoms = rest[such_idx+2:]
                          rest = rest[:such_idx]
-                         cond_sent = Sentence(text=" ".join(cond_atoms), atoms=cond_atoms)
-                         cond = self.translate_sentence(cond_sent, as_axiom=as_axiom)
+                         cond = self._translate_atoms(cond_atoms, as_axiom)
                  except: pass
 
-             if rest and rest[0] in ["a", "an"]:
+             if rest and rest[0] in _ARTICLES:
                  rest = rest[1:]
 
              is_negated = False
              if rest and rest[0] == "not":
                  is_negated = True
                  rest = rest[1:]
-                 if rest and rest[0] in ["a", "an"]:
+                 if rest and rest[0] in _ARTICLES:
                      rest = rest[1:]
 
              if rest and is_math(rest[-1]):
@@ -849,7 +1049,7 @@ class Translator:
                  of_idx = rest.index("of")
                  if of_idx + 1 < len(rest) and is_math(rest[of_idx+1]):
                      domain = parse_term(rest[of_idx+1])
-                     pred = Predicate("in", [term, domain])
+                     pred = mk_pred("in", [term, domain])
                      if cond: pred = And(pred, cond)
                      if is_negated: return Not(pred)
                      return pred
@@ -870,7 +1070,7 @@ class Translator:
              for seg in segments:
                  # Strip leading a/an if present
                  eff_seg = seg
-                 if eff_seg and eff_seg[0] in ["a", "an"]:
+                 if eff_seg and eff_seg[0] in _ARTICLES:
                      eff_seg = eff_seg[1:]
 
                  name_parts = []
@@ -878,13 +1078,13 @@ class Translator:
                  for w in eff_seg:
                      if is_math(w):
                          args.append(parse_term(w))
-                     elif w not in ["of", "in", "to", "with", "from"]:
+                     elif w not in _PREPOSITIONS:
                          name_parts.append(w)
 
                  if name_parts:
-                     noun = "_".join(name_parts)
+                     noun = _join_underscore(tuple(name_parts))
                      noun = self.normalize_noun(noun)
-                     preds.append(Predicate(noun, [term] + args))
+                     preds.append(mk_pred(noun, [term] + args))
 
              if preds:
                  if len(preds) == 1:
@@ -906,32 +1106,32 @@ class Translator:
         if clean_atoms and clean_atoms[0] == "Take":
              formulas = []
              cond = None
-             if "that" in clean_atoms:
-                 that_idx = clean_atoms.index("that")
+             if kw_mask & _B["that"]:
+                 that_idx = kw_first["that"]
                  if that_idx + 1 < n and is_math(clean_atoms[that_idx+1]):
                      cond = self.parse_math_safe(clean_atoms[that_idx+1])
 
-             limit = clean_atoms.index("such") if "such" in clean_atoms else n
+             limit = kw_first["such"] if kw_mask & _B["such"] else n
              for i in range(1, limit):
                  if is_math(clean_atoms[i]):
                      prev_word = clean_atoms[i-1] if i > 0 else ""
                      raw_math = clean_atoms[i]
-                     inner = raw_math.replace("$", "").replace(r"\[", "").replace(r"\]", "")
+                     inner = _MATH_DELIMS_SINGLE_RE.sub("", raw_math)
                      vars_str = inner.split(",")
 
                      for v_str in vars_str:
                          v_term = self.parse_math_safe(v_str.strip())
                          if isinstance(v_term, (Constant, Variable)):
-                             if prev_word in ["integer", "integers"]:
-                                 formulas.append(Predicate("integer", [v_term]))
-                             elif prev_word in ["map", "maps"]:
-                                 formulas.append(Predicate("map", [v_term]))
-                             elif prev_word in ["set", "sets"]:
-                                 formulas.append(Predicate("set", [v_term]))
+                             if prev_word in {"integer", "integers"}:
+                                 formulas.append(mk_pred("integer", [v_term]))
+                             elif prev_word in {"map", "maps"}:
+                                 formulas.append(mk_pred("map", [v_term]))
+                             elif prev_word in {"set", "sets"}:
+                                 formulas.append(mk_pred("set", [v_term]))
                              elif prev_word == "element":
                                  if i+1 < limit and clean_atoms[i+1] == "of" and i+2 < limit and is_math(clean_atoms[i+2]):
                                      domain = self.parse_math_safe(clean_atoms[i+2])
-                                     formulas.append(Predicate("in", [v_term, domain]))
+                                     formulas.append(mk_pred("in", [v_term, domain]))
 
              if cond:
                  formulas.append(cond)
@@ -952,7 +1152,7 @@ class Translator:
                      res = And(res, f)
                  return res
 
-        if clean_atoms and (clean_atoms[0] in ["Define", "define"] or (n > 1 and clean_atoms[0] == "Indeed" and clean_atoms[1] in ["Define", "define"])):
+        if clean_atoms and (clean_atoms[0] in {"Define", "define"} or (n > 1 and clean_atoms[0] == "Indeed" and clean_atoms[1] in {"Define", "define"})):
             defn = None
             for a in clean_atoms:
                 if is_math(a):
@@ -962,26 +1162,26 @@ class Translator:
                         break
 
             if defn:
-                if "for" in clean_atoms and "in" in clean_atoms:
+                if (kw_mask & (_B["for"] | _B["in"])) == (_B["for"] | _B["in"]):
                     try:
-                        f_idx = clean_atoms.index("for")
-                        i_idx = clean_atoms.index("in")
+                        f_idx = kw_first["for"]
+                        i_idx = kw_first["in"]
                         if f_idx < i_idx and f_idx + 1 < n and i_idx + 1 < n:
                             var = self.parse_math_safe(clean_atoms[f_idx+1])
                             domain = self.parse_math_safe(clean_atoms[i_idx+1])
                             if var and domain:
-                                v = Variable(var.name) if isinstance(var, Constant) else var
+                                v = _to_var(var)
                                 domain_axiom = None
                                 if isinstance(defn, Equal) and isinstance(defn.left, Function):
                                     fname = defn.left.name
-                                    z = Variable("z_dom")
-                                    f_term = Constant(fname)
-                                    dom_term = Function("dom", [f_term])
-                                    lhs = Predicate("in", [z, dom_term])
-                                    rhs = Predicate("in", [z, domain])
+                                    z = _V_Z_DOM
+                                    f_term = mk_const(fname)
+                                    dom_term = mk_func("dom", [f_term])
+                                    lhs = mk_pred("in", [z, dom_term])
+                                    rhs = mk_pred("in", [z, domain])
                                     domain_axiom = Quantifier("forall", [z], Iff(lhs, rhs))
 
-                                value_axiom = Quantifier("forall", [v], Implies(Predicate("in", [v, domain]), defn))
+                                value_axiom = Quantifier("forall", [v], Implies(mk_pred("in", [v, domain]), defn))
                                 if domain_axiom:
                                     return And(domain_axiom, value_axiom)
                                 return value_axiom
@@ -1025,7 +1225,7 @@ class Translator:
 
                         cond_str = cond_str.strip()
                         # Use simple splitting for now matching cnl_parser basics
-                        cond_atoms = [a for a in re.split(r'(\s+)', cond_str) if a.strip()]
+                        cond_atoms = [a for a in _WS_SPLIT_RE.split(cond_str) if a.strip()]
                         # A simple merge pass
                         merged_atoms = []
                         buffer = ""
@@ -1062,7 +1262,7 @@ class Translator:
                             merged_atoms.append(buffer)
 
                         # Construct Sentence
-                        cond_sent = Sentence(text=cond_str, atoms=merged_atoms)
+                        cond_sent = Sentence(atoms=merged_atoms, _text=cond_str)
                         # Always translate definition condition as axiom to preserve variables for quantification
                         cond_form = self.translate_sentence(cond_sent, as_axiom=True)
 
@@ -1074,20 +1274,20 @@ class Translator:
                                 body = cond_form
 
                             P_term = defn.left
-                            lhs = Predicate("in", [var, P_term])
+                            lhs = mk_pred("in", [var, P_term])
 
                             # Ensure var is Variable
-                            v_obj = Variable(var.name) if isinstance(var, (Variable, Constant)) else var
+                            v_obj = mk_var(var.name) if type(var) in (Variable, Constant) else var
 
                             return Quantifier("forall", [v_obj], Iff(lhs, body))
 
                 return defn
 
-            return Predicate("definition", [])
+            return _P_DEFINITION
 
-        if "Contradiction" in clean_atoms or "contradiction" in clean_atoms:
-            return Predicate("false", [])
-        if "End" in clean_atoms or "qed" in clean_atoms:
+        if kw_mask & (_B["Contradiction"] | _B["contradiction"]):
+            return _P_FALSE
+        if kw_mask & (_B["End"] | _B["qed"]):
             return None
 
         if n_eff >= 3 and effective_atoms[1] == "has":
@@ -1097,7 +1297,7 @@ class Translator:
             is_negated_has = False
             if quantifier == "no":
                 is_negated_has = True
-            elif quantifier in ["a", "an"]:
+            elif quantifier in _ARTICLES:
                 is_negated_has = False
             else:
                 noun_start = 2
@@ -1109,14 +1309,14 @@ class Translator:
             for w in noun_atoms:
                 if is_math(w):
                     args.append(parse_term(w))
-                elif w not in ["of", "in", "to", "with", "from"]:
+                elif w not in _PREPOSITIONS:
                     name_parts.append(w)
 
             if name_parts:
-                noun = "_".join(name_parts)
+                noun = _join_underscore(tuple(name_parts))
                 noun = self.normalize_noun(noun)
 
-                x = Variable("x_has")
+                x = _V_X_HAS
                 # Predicate is noun(x, term, other_args...) ?
                 # Or noun(x, other_args..., term)?
                 # "T has a supremum in S" -> supremum(x, T, S).
@@ -1128,9 +1328,9 @@ class Translator:
                 # The predicate is supremum(x, T, S).
                 # My generic parser extracted args=[S].
                 # Name=supremum.
-                # So we want Predicate("supremum", [x, term] + args).
+                # So we want mk_pred("supremum", [x, term] + args).
 
-                prop = Quantifier("exists", [x], Predicate(noun, [x, term] + args))
+                prop = Quantifier("exists", [x], mk_pred(noun, [x, term] + args))
                 if is_negated_has:
                     return Not(prop)
                 return prop
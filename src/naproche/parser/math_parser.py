@@ -1,5 +1,5 @@
 from lark import Lark, Transformer, v_args, Token
-from naproche.logic.fol import Term, Formula, Predicate, Function, Variable, Constant, Equal, Implies, Iff, And
+from naproche.logic.fol import Term, Formula, Variable, Constant, Equal, Implies, Iff, And, mk_var, mk_const, mk_func, mk_pred
 
 math_grammar = r"""
     ?start: expression
@@ -125,20 +125,20 @@ class MathTransformer(Transformer):
         if op_str == "=":
             return Equal(left, right)
         elif op_str == "\\in":
-            return Predicate("in", [left, right])
+            return mk_pred("in", [left, right])
         elif op_str == "<":
-            return Predicate("less", [left, right])
+            return mk_pred("less", [left, right])
         elif op_str == "\\leq" or op_str == "\\le":
-            return Predicate("leq", [left, right])
+            return mk_pred("leq", [left, right])
         elif op_str == "\\geq" or op_str == "\\ge":
-            return Predicate("geq", [left, right])
+            return mk_pred("geq", [left, right])
         elif op_str == "\\neq":
-            return Predicate("neq", [left, right])
+            return mk_pred("neq", [left, right])
         elif op_str == "\\subseteq":
-            return Predicate("subset", [left, right])
+            return mk_pred("subset", [left, right])
         elif op_str == ":":
-            return Predicate("colon", [left, right])
-        return Predicate(op_str.replace("\\", ""), [left, right])
+            return mk_pred("colon", [left, right])
+        return mk_pred(op_str.replace("\\", ""), [left, right])
 
     def arrow_term(self, items):
         # items: [term, op, term, op, term...]
@@ -153,7 +153,7 @@ class MathTransformer(Transformer):
             op = items[i]
             right = items[i+1]
             op_str = str(op).replace("\\", "")
-            node = Function(op_str, [node, right])
+            node = mk_func(op_str, [node, right])
         return node
 
     def set_term(self, items):
@@ -162,41 +162,41 @@ class MathTransformer(Transformer):
             op = items[i]
             right = items[i+1]
             op_str = str(op).replace("\\", "")
-            node = Function(op_str, [node, right])
+            node = mk_func(op_str, [node, right])
         return node
 
     def bin_op_other(self, items):
         left, op, right = items
         op_str = str(op).replace("\\", "")
-        return Function(op_str, [left, right])
+        return mk_func(op_str, [left, right])
 
     def simple_term(self, items):
         item = items[0]
         if isinstance(item, Token):
             if item.type == "VARIABLE":
-                return Variable(item.value)
+                return mk_var(item.value)
             elif item.type == "NUMBER":
-                return Constant(f"'{item.value}'")
+                return mk_const(f"'{item.value}'")
             elif item.type == "LATEX_CMD":
-                return Constant(item.value[1:])
+                return mk_const(item.value[1:])
             elif item.type == "IDENTIFIER":
-                return Constant(item.value)
+                return mk_const(item.value)
         return item
 
     def tuple(self, items):
         if len(items) == 2:
-            return Function("pair", items)
-        return Function("tuple", items)
+            return mk_func("pair", items)
+        return mk_func("tuple", items)
 
     def set_enum(self, items):
         if not items:
-            return Constant("empty_set")
+            return mk_const("empty_set")
         if len(items) == 1:
-            return Function("singleton", items)
-        return Function("set_enum", items)
+            return mk_func("singleton", items)
+        return mk_func("set_enum", items)
 
     def VARIABLE(self, token):
-        return Variable(token.value)
+        return mk_var(token.value)
 
     def func_app(self, items):
         first = items[0]
@@ -227,11 +227,11 @@ class MathTransformer(Transformer):
                  func_name = str(first)
                  args = items[1:]
 
-        return Function(func_name, args)
+        return mk_func(func_name, args)
 
     def subscript(self, items):
         base, sub = items
-        return Function("subscript", [base, sub])
+        return mk_func("subscript", [base, sub])
 
     def set_comp(self, items):
         # Return special function/object to be handled by translator
@@ -246,7 +246,7 @@ class MathTransformer(Transformer):
         else:
             cond_str = str(cond)
 
-        return Function("set_comp", [expr, Constant(f"'{cond_str}'")])
+        return mk_func("set_comp", [expr, mk_const(f"'{cond_str}'")])
 
     def term(self, items):
         return items[0]
@@ -1,9 +1,20 @@
 from typing import List, Optional
 from naproche.logic.fol import Formula
 
+# Rendered fof() lines keyed by formula name. Across the steps of a proof the
+# axiom/context prefix is identical, so re-serializing every formula per step
+# dominates problem emission. The identity check guards names that get reused
+# with different formulas (e.g. the conjecture).
+_fof_cache = {}
+
 
 def to_tptp(formula: Formula, name: str, role: str) -> str:
-    return f"fof({name}, {role}, {formula})."
+    cached = _fof_cache.get(name)
+    if cached is not None and cached[0] is formula and cached[1] == role:
+        return cached[2]
+    line = f"fof({name}, {role}, {formula})."
+    _fof_cache[name] = (formula, role, line)
+    return line
 
 
 def formulas_to_tptp_file(
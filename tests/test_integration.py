@@ -1,6 +1,11 @@
+import pickle
+import shutil
+import tempfile
 import unittest
 import os
+from naproche.check import engine as engine_mod
 from naproche.check.engine import Engine
+from naproche.logic.models import Sentence
 from naproche.parser.preprocessor import extract_forthel_blocks
 from naproche.parser.cnl_parser import parse_cnl
 from naproche.logic.converter import convert_ast
@@ -42,6 +47,39 @@ class TestIntegration(unittest.TestCase):
         total = cursor.fetchone()[0]
         self.assertTrue(total > 0)
 
+    def test_ast_cache_round_trip(self):
+        base_dir = tempfile.mkdtemp()
+        cache_dir = tempfile.mkdtemp()
+        old_cache_dir = engine_mod.AST_CACHE_DIR
+        engine_mod.AST_CACHE_DIR = cache_dir
+        try:
+            with open(os.path.join(base_dir, "inc.ftl.tex"), "w") as f:
+                f.write("\\begin{forthel}\nLet $X$ be a set.\n\\end{forthel}\n")
+
+            engine = Engine(base_path=base_dir)
+            engine.process_file("inc.ftl.tex")
+
+            pickles = os.listdir(cache_dir)
+            self.assertEqual(len(pickles), 1)
+            # The schema tag must be part of the key so bumping it orphans
+            # old pickles instead of serving stale statements.
+            self.assertIn(f"-s{engine_mod._AST_CACHE_SCHEMA}", pickles[0])
+
+            with open(os.path.join(cache_dir, pickles[0]), "rb") as cf:
+                cached = pickle.load(cf)
+            self.assertEqual(len(cached), 1)
+            self.assertIsInstance(cached[0], Sentence)
+            self.assertEqual(cached[0].atoms, ["Let", "$X$", "be", "a", "set", "."])
+
+            # A fresh engine must serve the cached pickle, not rewrite it.
+            engine2 = Engine(base_path=base_dir)
+            engine2.process_file("inc.ftl.tex")
+            self.assertEqual(os.listdir(cache_dir), pickles)
+        finally:
+            engine_mod.AST_CACHE_DIR = old_cache_dir
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            shutil.rmtree(base_dir, ignore_errors=True)
+
     def test_cantor_runs(self):
         if not os.path.exists(self.cantor_file):
             return
@@ -5,6 +5,7 @@ from naproche.parser.preprocessor import extract_forthel_blocks
 from naproche.parser.cnl_parser import parse_cnl
 from naproche.logic.converter import convert_ast
 from naproche.logic.translator import Translator
+from naproche.logic.fol import Implies, Quantifier, mk_func, mk_pred, mk_var
 from naproche.logic.models import Sentence
 
 
@@ -18,16 +19,30 @@ class TestNaproche(unittest.TestCase):
 
     def test_translator(self):
         t = Translator()
-        s = Sentence(text="Let $X$ be a set", atoms=["Let", "$X$", "be", "a", "set"])
+        s = Sentence(atoms=["Let", "$X$", "be", "a", "set"])
         f = t.translate_sentence(s, as_axiom=True)
         # Should be Predicate("set", [Variable("X")])
         self.assertEqual(str(f), "set(X)")
 
-        s2 = Sentence(text="Let $X$ be a set", atoms=["Let", "$X$", "be", "a", "set"])
+        s2 = Sentence(atoms=["Let", "$X$", "be", "a", "set"])
         f2 = t.translate_sentence(s2, as_axiom=False)
         # Should be Predicate("set", [Constant("x")])
         self.assertEqual(str(f2), "set(x)")
 
+    def test_closure_quantifies_function_applications(self):
+        # Function applications in formula position (geometry-style atoms
+        # like Cong/Betw) must contribute their variables to closure, which
+        # then emits an explicit universal prefix instead of leaning on
+        # TPTP's implicit quantification.
+        t = Translator()
+        f = Implies(
+            mk_func("Cong", [mk_var("X"), mk_var("Y")]),
+            mk_pred("Betw", [mk_var("Y")]),
+        )
+        c = t.closure(f)
+        self.assertIsInstance(c, Quantifier)
+        self.assertEqual(str(c), "(! [X,Y] : ('Cong'(X,Y) => 'Betw'(Y)))")
+
 
 class TestIntegration(unittest.TestCase):
     def setUp(self):